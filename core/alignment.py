@@ -0,0 +1,126 @@
+from array import array
+
+from core.dp import _lower_chars
+from core.suffix_automaton import longest_common_substring_sam
+
+
+def _levenshtein_row(a, b):
+    """Retorna a última linha do DP de Levenshtein entre ``a`` e cada prefixo de ``b``."""
+    n = len(b)
+    prev = array("i", range(n + 1))
+    curr = array("i", [0]) * (n + 1)
+    for i, ca in enumerate(a, start=1):
+        curr[0] = i
+        for j in range(1, n + 1):
+            cost = 0 if ca == b[j - 1] else 1
+            curr[j] = min(prev[j] + 1, curr[j - 1] + 1, prev[j - 1] + cost)
+        prev, curr = curr, prev
+    return prev
+
+
+def _lcs_row(a, b):
+    """Retorna a última linha do DP da LCS entre ``a`` e cada prefixo de ``b``."""
+    n = len(b)
+    prev = array("i", [0]) * (n + 1)
+    curr = array("i", [0]) * (n + 1)
+    for ca in a:
+        for j in range(1, n + 1):
+            if ca == b[j - 1]:
+                curr[j] = prev[j - 1] + 1
+            else:
+                curr[j] = max(prev[j], curr[j - 1])
+        prev, curr = curr, prev
+    return prev
+
+
+def _levenshtein_script(a, b, i0, j0, script):
+    """Adiciona a ``script`` as operações que transformam ``a`` em ``b`` (Hirschberg)."""
+    m, n = len(a), len(b)
+    if m == 0:
+        script.extend(("insert", None, j0 + j) for j in range(n))
+        return
+    if n == 0:
+        script.extend(("delete", i0 + i, None) for i in range(m))
+        return
+    if m == 1:
+        try:
+            k = b.index(a[0])
+            op = "equal"
+        except ValueError:
+            k = 0
+            op = "replace"
+        script.extend(("insert", None, j0 + j) for j in range(k))
+        script.append((op, i0, j0 + k))
+        script.extend(("insert", None, j0 + j) for j in range(k + 1, n))
+        return
+
+    mid = m // 2
+    left = _levenshtein_row(a[:mid], b)
+    right = _levenshtein_row(a[: mid - 1 : -1], b[::-1])
+    split = min(range(n + 1), key=lambda j: left[j] + right[n - j])
+
+    _levenshtein_script(a[:mid], b[:split], i0, j0, script)
+    _levenshtein_script(a[mid:], b[split:], i0 + mid, j0 + split, script)
+
+
+def _lcs_indices(a, b, i0, indices):
+    """Adiciona a ``indices`` as posições de ``a`` que formam uma LCS com ``b`` (Hirschberg)."""
+    m, n = len(a), len(b)
+    if m == 0 or n == 0:
+        return
+    if m == 1:
+        if a[0] in b:
+            indices.append(i0)
+        return
+
+    mid = m // 2
+    left = _lcs_row(a[:mid], b)
+    right = _lcs_row(a[: mid - 1 : -1], b[::-1])
+    split = max(range(n + 1), key=lambda j: left[j] + right[n - j])
+
+    _lcs_indices(a[:mid], b[:split], i0, indices)
+    _lcs_indices(a[mid:], b[split:], i0 + mid, indices)
+
+
+def levenshtein_alignment(s1, s2):
+    """
+    Calcula a distância de Levenshtein e o script de edição que transforma ``s1`` em ``s2``.
+
+    O script é uma lista de tuplas ``(operacao, i, j)``, onde ``operacao`` é "equal",
+    "replace", "delete" ou "insert" e ``i``/``j`` são as posições em ``s1``/``s2``
+    (``None`` quando a operação não consome caractere daquela string). Usa o
+    divide-and-conquer de Hirschberg, sem guardar a matriz completa.
+
+    Complexidade de tempo: O(m * n), cerca de 2x o cálculo só da distância
+    Complexidade de espaço: O(m + n)
+    """
+    script = []
+    _levenshtein_script(_lower_chars(s1), _lower_chars(s2), 0, 0, script)
+    distance = sum(1 for op, _, _ in script if op != "equal")
+    return distance, script
+
+
+def longest_common_subsequence_string(s1, s2):
+    """
+    Retorna uma maior subsequência comum entre duas strings (com os caracteres de ``s1``).
+
+    Usa o divide-and-conquer de Hirschberg, sem guardar a matriz completa.
+
+    Complexidade de tempo: O(m * n), cerca de 2x o cálculo só do comprimento
+    Complexidade de espaço: O(m + n)
+    """
+    indices = []
+    _lcs_indices(_lower_chars(s1), _lower_chars(s2), 0, indices)
+    return "".join(s1[i] for i in indices)
+
+
+def longest_common_substring_offsets(s1, s2):
+    """
+    Retorna ``(comprimento, inicio_em_s1, inicio_em_s2)`` da maior substring comum.
+
+    Os índices são -1 quando as strings não têm caractere em comum.
+
+    Complexidade de tempo: O(m + n)
+    Complexidade de espaço: O(m)
+    """
+    return longest_common_substring_sam(s1, s2, with_offsets=True)
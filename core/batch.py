@@ -0,0 +1,152 @@
+from core import dp
+from core.suffix_automaton import SuffixAutomaton
+
+
+class PreparedText:
+    """
+    Texto pré-processado uma única vez para ser comparado com vários outros.
+
+    Guarda os caracteres em minúsculo e monta sob demanda as máscaras Peq dos
+    kernels bit-paralelos e o autômato de sufixos da maior substring comum.
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.chars = dp._lower_chars(text)
+        self._masks = None
+        self._automaton = None
+
+    def __len__(self):
+        return len(self.chars)
+
+    @property
+    def masks(self):
+        """Máscaras Peq dos caracteres do texto (montadas na primeira utilização)."""
+        if self._masks is None:
+            self._masks = dp._pattern_masks(self.chars)
+        return self._masks
+
+    @property
+    def automaton(self):
+        """Autômato de sufixos do texto (montado na primeira utilização)."""
+        if self._automaton is None:
+            self._automaton = SuffixAutomaton(self.text)
+        return self._automaton
+
+
+def _levenshtein_prepared(a, b):
+    if len(a) < len(b):
+        a, b = b, a
+    if not len(b):
+        return len(a)
+    return dp._myers_distance(a.masks, len(a), b.chars)
+
+
+def _lcs_prepared(a, b):
+    if len(a) < len(b):
+        a, b = b, a
+    if not len(b):
+        return 0
+    return dp._lcs_bitparallel(a.masks, len(a), b.chars)
+
+
+def _substring_prepared(a, b):
+    return a.automaton.match_chars(b.chars)
+
+
+# Algoritmos de core.dp que têm um kernel equivalente sobre textos pré-processados.
+_PREPARED_KERNELS = {
+    dp.levenshtein_distance_iter: _levenshtein_prepared,
+    dp.levenshtein_distance_rec: _levenshtein_prepared,
+    dp.levenshtein_distance_linear: _levenshtein_prepared,
+    dp.levenshtein_distance_bitparallel: _levenshtein_prepared,
+    dp.levenshtein_distance_stack: _levenshtein_prepared,
+    dp.levenshtein_distance_auto: _levenshtein_prepared,
+    dp.longest_common_subsequence_iter: _lcs_prepared,
+    dp.longest_common_subsequence_rec: _lcs_prepared,
+    dp.longest_common_subsequence_bitparallel: _lcs_prepared,
+    dp.longest_common_subsequence_stack: _lcs_prepared,
+    dp.longest_common_subsequence_auto: _lcs_prepared,
+    dp.longest_common_substring_iter: _substring_prepared,
+    dp.longest_common_substring_rec: _substring_prepared,
+    dp.longest_common_substring_stack: _substring_prepared,
+    dp.longest_common_substring_auto: _substring_prepared,
+}
+
+
+# Resultado de cada kernel ao comparar um texto com ele mesmo, sem rodar o kernel.
+_SELF_SCORES = {
+    _levenshtein_prepared: lambda text: 0,
+    _lcs_prepared: len,
+    _substring_prepared: len,
+}
+
+
+def self_score(text, algorithm=dp.levenshtein_distance_iter):
+    """
+    Retorna o resultado de ``algorithm`` ao comparar um ``PreparedText`` com ele mesmo.
+
+    Para os algoritmos de ``core.dp`` o valor é conhecido (distância 0 ou o tamanho do
+    texto); os demais são chamados normalmente.
+    """
+    kernel = prepared_kernel(algorithm)
+    score = _SELF_SCORES.get(kernel)
+    return score(text) if score is not None else kernel(text, text)
+
+
+def prepared_kernel(algorithm):
+    """
+    Retorna uma função ``(PreparedText, PreparedText) -> valor`` equivalente a ``algorithm``.
+
+    Algoritmos sem kernel próprio são chamados diretamente com os textos originais.
+    """
+    kernel = _PREPARED_KERNELS.get(algorithm)
+    if kernel is not None:
+        return kernel
+    return lambda a, b: algorithm(a.text, b.text)
+
+
+def score_pairs(prepared, index_pairs, algorithm=dp.levenshtein_distance_iter):
+    """
+    Compara os pares de índices ``(i, j)`` de uma lista de ``PreparedText``.
+
+    Retorna um gerador com o resultado de cada par, na mesma ordem de ``index_pairs``.
+    """
+    kernel = prepared_kernel(algorithm)
+    for i, j in index_pairs:
+        yield kernel(prepared[i], prepared[j])
+
+
+def distance_matrix(texts, algorithm=dp.levenshtein_distance_iter):
+    """
+    Calcula a matriz N x N com o resultado de ``algorithm`` para todos os pares de textos.
+
+    Cada texto é pré-processado uma única vez e reaproveitado em todos os pares em que
+    aparece. Como os três algoritmos são simétricos, só o triângulo superior (sem a
+    diagonal) é calculado; a diagonal vem de ``self_score``, sem chamar o kernel.
+
+    Complexidade de tempo: O(N) pré-processamentos + O(N²) comparações
+    """
+    prepared = [PreparedText(text) for text in texts]
+    size = len(prepared)
+    index_pairs = [(i, j) for i in range(size) for j in range(i + 1, size)]
+
+    matrix = [[0] * size for _ in range(size)]
+    for i, text in enumerate(prepared):
+        matrix[i][i] = self_score(text, algorithm)
+    for (i, j), value in zip(
+        index_pairs, score_pairs(prepared, index_pairs, algorithm)
+    ):
+        matrix[i][j] = matrix[j][i] = value
+    return matrix
+
+
+def one_vs_many(reference, candidates, algorithm=dp.levenshtein_distance_iter):
+    """
+    Compara um texto de referência com vários candidatos, pré-processando a referência uma única vez.
+
+    Retorna a lista de resultados na ordem de ``candidates``.
+    """
+    kernel = prepared_kernel(algorithm)
+    reference = PreparedText(reference)
+    return [kernel(reference, PreparedText(candidate)) for candidate in candidates]
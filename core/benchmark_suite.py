@@ -0,0 +1,449 @@
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import os
+import random
+import string
+
+from core import dp, o_notation
+from core.dp_numpy import (
+    HAS_NUMPY,
+    levenshtein_distance_numpy,
+    longest_common_subsequence_numpy,
+    longest_common_substring_numpy,
+)
+from core.parallel_sort import parallel_sort
+from core.suffix_automaton import longest_common_substring_sam
+from utils.benchmark import (
+    size_axis,
+    benchmark,
+    export_json,
+    fit_complexity,
+    fit_power_law,
+)
+from utils.measure_time import formatar_kib, formatar_ms
+
+DEFAULT_OUTPUT = "data/benchmarks/latest.json"
+
+# Kernels de core/dp.py (e backends equivalentes) que recebem duas strings.
+DP_KERNELS = {
+    "longest_common_subsequence_iter": dp.longest_common_subsequence_iter,
+    "longest_common_subsequence_rec": dp.longest_common_subsequence_rec,
+    "longest_common_subsequence_stack": dp.longest_common_subsequence_stack,
+    "longest_common_subsequence_bitparallel": dp.longest_common_subsequence_bitparallel,
+    "longest_common_substring_iter": dp.longest_common_substring_iter,
+    "longest_common_substring_rec": dp.longest_common_substring_rec,
+    "longest_common_substring_stack": dp.longest_common_substring_stack,
+    "longest_common_substring_sam": longest_common_substring_sam,
+    "levenshtein_distance_iter": dp.levenshtein_distance_iter,
+    "levenshtein_distance_rec": dp.levenshtein_distance_rec,
+    "levenshtein_distance_stack": dp.levenshtein_distance_stack,
+    "levenshtein_distance_linear": dp.levenshtein_distance_linear,
+    "levenshtein_distance_bitparallel": dp.levenshtein_distance_bitparallel,
+}
+if HAS_NUMPY:
+    DP_KERNELS.update(
+        {
+            "longest_common_subsequence_numpy": longest_common_subsequence_numpy,
+            "longest_common_substring_numpy": longest_common_substring_numpy,
+            "levenshtein_distance_numpy": levenshtein_distance_numpy,
+        }
+    )
+
+# Algoritmos de ordenação de core/o_notation.py que recebem uma lista.
+SORT_KERNELS = {
+    "insertion_sort": o_notation.insertion_sort,
+    "merge_sort": o_notation.merge_sort,
+    "bottom_up_merge_sort": o_notation.bottom_up_merge_sort,
+    "hybrid_sort": o_notation.hybrid_sort,
+    "numeric_sort": o_notation.numeric_sort,
+}
+
+
+def _random_text(rng, n, alphabet=string.ascii_letters):
+    return "".join(rng.choices(alphabet, k=n))
+
+
+def _random_pair(rng, n):
+    return _random_text(rng, n), _random_text(rng, n)
+
+
+def _identical_pair(rng, n):
+    text = _random_text(rng, n)
+    return text, text
+
+
+def _disjoint_pair(rng, n):
+    """Strings sem nenhum caractere em comum (metades distintas do alfabeto minúsculo)."""
+    return (
+        _random_text(rng, n, string.ascii_lowercase[:13]),
+        _random_text(rng, n, string.ascii_lowercase[13:]),
+    )
+
+
+def _reversed_pair(rng, n):
+    text = _random_text(rng, n)
+    return text, text[::-1]
+
+
+def _nearly_identical_pair(rng, n):
+    """Uma string e uma cópia com cerca de 1% dos caracteres trocados (pelo menos um)."""
+    text = _random_text(rng, n)
+    chars = list(text)
+    for i in rng.sample(range(n), max(1, n // 100)):
+        chars[i] = "#"
+    return text, "".join(chars)
+
+
+# Tamanho da segunda string no formato "fixed_n".
+FIXED_N = 32
+
+
+def _fixed_n_pair(rng, n):
+    """Primeira string com ``n`` letras e segunda sempre com ``FIXED_N``: só ``m`` varia."""
+    return _random_text(rng, n), _random_text(rng, FIXED_N)
+
+
+# Formatos de entrada da varredura dos kernels de strings: (rng, n) -> (s1, s2).
+# Em todos, menos "fixed_n", as duas strings têm o mesmo tamanho (m == n), e aí
+# O(n²) e O(m·n) não se distinguem.
+STRING_SHAPES = {
+    "random": _random_pair,
+    "identical": _identical_pair,
+    "disjoint": _disjoint_pair,
+    "reversed": _reversed_pair,
+    "nearly_identical": _nearly_identical_pair,
+    "fixed_n": _fixed_n_pair,
+}
+
+
+def _nearly_sorted_list(rng, n):
+    """Lista ordenada com cerca de 1% dos elementos trocados de posição."""
+    data = list(range(n))
+    for _ in range(max(1, n // 100)):
+        i, j = rng.randrange(n), rng.randrange(n)
+        data[i], data[j] = data[j], data[i]
+    return data
+
+
+# Formatos de entrada da varredura dos algoritmos de ordenação: (rng, n) -> (lista,).
+SORT_SHAPES = {
+    "random": lambda rng, n: ([rng.randint(0, 5 * n) for _ in range(n)],),
+    "identical": lambda rng, n: ([7] * n,),
+    "sorted": lambda rng, n: (list(range(n)),),
+    "reversed": lambda rng, n: (list(range(n, 0, -1)),),
+    "nearly_sorted": lambda rng, n: (_nearly_sorted_list(rng, n),),
+}
+
+
+def geometric_sizes(start, stop, factor=2):
+    """Tamanhos ``start, start * factor, ...`` até ``stop`` (inclusive)."""
+    sizes = []
+    size = start
+    while size <= stop:
+        sizes.append(size)
+        size = int(size * factor)
+    return sizes
+
+
+def sweep(kernels, shapes, sizes, warmup=1, repeat=3, seed=42, memory=False):
+    """
+    Mede cada kernel em cada formato de entrada e em cada tamanho de ``sizes``.
+
+    Os resultados trazem ``params = {"n": tamanho, "shape": formato}``. Nos kernels
+    de duas strings, ``m`` e ``n`` são os tamanhos reais da primeira e da segunda.
+    """
+    results = []
+    for shape, make_args in shapes.items():
+        for n in sizes:
+            args = make_args(random.Random(seed), n)
+            params = {"n": n, "shape": shape}
+            if len(args) == 2 and all(isinstance(arg, str) for arg in args):
+                params.update(m=len(args[0]), n=len(args[1]))
+            for name, func in kernels.items():
+                results.append(
+                    benchmark(
+                        func,
+                        args,
+                        name=name,
+                        warmup=warmup,
+                        repeat=repeat,
+                        params=params,
+                        memory=memory,
+                    )
+                )
+    return results
+
+
+def fit_sweep(results):
+    """
+    Ajusta as medianas de cada par (kernel, formato) às curvas de complexidade.
+
+    Retorna ``{(kernel, formato): ComplexityFit}``. Quando os resultados têm pico de
+    memória, o expoente do crescimento da memória fica em ``memory_exponents``, o
+    segundo valor retornado, com as mesmas chaves.
+    """
+    groups = {}
+    for result in results:
+        key = (result.name, result.params["shape"])
+        size = (result.params.get("m", result.params["n"]), result.params["n"])
+        groups.setdefault(key, []).append((size, result.median_ms, result.peak_bytes))
+
+    fits = {}
+    memory_exponents = {}
+    for key, points in groups.items():
+        if len({size for size, _, _ in points}) < 2:
+            continue
+        points.sort()
+        sizes = [size for size, _, _ in points]
+        fits[key] = fit_complexity(sizes, [t for _, t, _ in points])
+        peaks = [peak for _, _, peak in points]
+        if all(peaks):
+            memory_exponents[key] = fit_power_law(size_axis(sizes), peaks)[0]
+    return fits, memory_exponents
+
+
+def run_kernel_benchmarks(
+    text_size=100, sort_size=1000, warmup=1, repeat=7, memory=False
+):
+    """
+    Mede todos os kernels registrados com as mesmas entradas de ``algorithm_tests``
+    (strings aleatórias de ``text_size`` letras) e de ``big_o_analysis`` (lista
+    reversa de ``sort_size`` elementos).
+    """
+    rng = random.Random(42)
+    s1 = "".join(rng.choices(string.ascii_letters, k=text_size))
+    s2 = "".join(rng.choices(string.ascii_letters, k=text_size))
+    data = list(range(sort_size, 0, -1))
+
+    results = []
+    for name, func in DP_KERNELS.items():
+        results.append(
+            benchmark(
+                func,
+                (s1, s2),
+                name=name,
+                warmup=warmup,
+                repeat=repeat,
+                params={"m": text_size, "n": text_size},
+                memory=memory,
+            )
+        )
+    for name, func in SORT_KERNELS.items():
+        results.append(
+            benchmark(
+                func,
+                (data,),
+                name=name,
+                warmup=warmup,
+                repeat=repeat,
+                params={"n": sort_size, "shape": "reversed"},
+                memory=memory,
+            )
+        )
+    return results
+
+
+def results_table(results, title="Benchmark dos Kernels"):
+    """Monta uma tabela Rich com as estatísticas de cada resultado."""
+    from rich.table import Table
+
+    table = Table(title=title, show_lines=True)
+    table.add_column("Kernel", style="cyan")
+    for column in ("Mín (ms)", "Mediana (ms)", "p95 (ms)", "Desvio (ms)"):
+        table.add_column(column, justify="right", style="green")
+    with_memory = any(result.peak_bytes is not None for result in results)
+    if with_memory:
+        table.add_column("Pico de Memória (KiB)", justify="right", style="yellow")
+        table.add_column("Blocos Retidos ao Final", justify="right", style="yellow")
+    for result in results:
+        row = [
+            result.name,
+            formatar_ms(result.min_ms),
+            formatar_ms(result.median_ms),
+            formatar_ms(result.p95_ms),
+            formatar_ms(result.stddev_ms),
+        ]
+        if with_memory:
+            row += [formatar_kib(result.peak_bytes or 0), str(result.retained_blocks)]
+        table.add_row(*row)
+    return table
+
+
+def fits_table(fits, memory_exponents=None, title="Ajuste de Complexidade"):
+    """Monta uma tabela Rich com a curva escolhida e o expoente ajustado de cada kernel."""
+    from rich.table import Table
+
+    table = Table(title=title, show_lines=True)
+    table.add_column("Kernel", style="cyan")
+    table.add_column("Entrada", style="magenta")
+    table.add_column("Melhor Curva", style="yellow")
+    table.add_column("Constante (ms)", justify="right", style="green")
+    table.add_column("Expoente", justify="right", style="green")
+    if memory_exponents:
+        table.add_column("Expoente Memória", justify="right", style="yellow")
+    for key, fit in fits.items():
+        row = [*key, fit.best_model, f"{fit.constant:.3e}", f"{fit.exponent:.2f}"]
+        if memory_exponents:
+            exponent = memory_exponents.get(key)
+            row.append("-" if exponent is None else f"{exponent:.2f}")
+        table.add_row(*row)
+    return table
+
+
+def run_sweep(
+    text_sizes=None,
+    sort_sizes=None,
+    warmup=1,
+    repeat=3,
+    include_recursive=False,
+    memory=False,
+):
+    """
+    Varre todos os kernels em faixas geométricas de tamanhos e formatos de entrada.
+
+    As versões ``_rec`` ficam de fora por padrão, pois estouram o limite de recursão
+    nos tamanhos maiores. Retorna ``(resultados, ajustes, expoentes_de_memoria)``.
+    """
+    text_sizes = text_sizes or geometric_sizes(32, 512)
+    sort_sizes = sort_sizes or geometric_sizes(256, 4096)
+    dp_kernels = {
+        name: func
+        for name, func in DP_KERNELS.items()
+        if include_recursive or not name.endswith("_rec")
+    }
+
+    results = sweep(
+        dp_kernels, STRING_SHAPES, text_sizes, warmup, repeat, memory=memory
+    )
+    results += sweep(
+        SORT_KERNELS, SORT_SHAPES, sort_sizes, warmup, repeat, memory=memory
+    )
+    return results, *fit_sweep(results)
+
+
+def run_parallel_benchmarks(size=200_000, max_workers=None, warmup=1, repeat=3):
+    """
+    Mede ``merge_sort`` e ``parallel_sort`` com 1 a ``max_workers`` processos na mesma
+    lista aleatória de ``size`` inteiros.
+
+    O pool de cada quantidade de processos é criado antes da medição, então o custo de
+    iniciar os processos fica de fora. O primeiro resultado é a referência (``merge_sort``).
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    rng = random.Random(42)
+    data = [rng.randint(0, 5 * size) for _ in range(size)]
+
+    results = [
+        benchmark(
+            o_notation.merge_sort,
+            (data,),
+            warmup=warmup,
+            repeat=repeat,
+            params={"n": size, "workers": 1},
+        )
+    ]
+    for workers in range(1, max_workers + 1):
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results.append(
+                benchmark(
+                    parallel_sort,
+                    (data, workers),
+                    {"executor": executor},
+                    warmup=warmup,
+                    repeat=repeat,
+                    params={"n": size, "workers": workers},
+                )
+            )
+    return results
+
+
+def speedup_table(results, title="Speedup do Sort Paralelo"):
+    """Monta uma tabela Rich com o speedup de cada resultado em relação ao primeiro."""
+    from rich.table import Table
+
+    baseline = results[0].median_ms
+    table = Table(title=title, show_lines=True)
+    table.add_column("Kernel", style="cyan")
+    table.add_column("Processos", justify="right", style="magenta")
+    table.add_column("Mediana (ms)", justify="right", style="green")
+    table.add_column("Speedup", justify="right", style="yellow")
+    for result in results:
+        table.add_row(
+            result.name,
+            str(result.params["workers"]),
+            formatar_ms(result.median_ms),
+            f"{baseline / result.median_ms:.2f}x" if result.median_ms > 0 else "-",
+        )
+    return table
+
+
+def main(argv=None):
+    from rich.console import Console
+
+    parser = argparse.ArgumentParser(
+        description="Mede os kernels de core/dp.py e core/o_notation.py e exporta os resultados em JSON."
+    )
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--text-size", type=int, default=100)
+    parser.add_argument("--sort-size", type=int, default=1000)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument(
+        "--sweep",
+        action="store_true",
+        help="varre tamanhos geométricos e formatos de entrada e ajusta curvas de complexidade",
+    )
+    parser.add_argument("--max-text-size", type=int, default=512)
+    parser.add_argument("--max-sort-size", type=int, default=4096)
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="registra também o pico de memória (tracemalloc) de cada kernel",
+    )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="mede o speedup do sort paralelo contra o merge_sort de 1 a --max-workers processos",
+    )
+    parser.add_argument("--parallel-size", type=int, default=200_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    console = Console()
+    metadata = None
+    if args.parallel:
+        results = run_parallel_benchmarks(
+            args.parallel_size, args.max_workers, args.warmup, args.repeat
+        )
+        console.print(speedup_table(results))
+    elif args.sweep:
+        results, fits, memory_exponents = run_sweep(
+            geometric_sizes(32, args.max_text_size),
+            geometric_sizes(256, args.max_sort_size),
+            args.warmup,
+            args.repeat,
+            memory=args.memory,
+        )
+        console.print(fits_table(fits, memory_exponents))
+        metadata = {
+            "fits": [
+                {
+                    "kernel": name,
+                    "shape": shape,
+                    **vars(fit),
+                    "memory_exponent": memory_exponents.get((name, shape)),
+                }
+                for (name, shape), fit in fits.items()
+            ]
+        }
+    else:
+        results = run_kernel_benchmarks(
+            args.text_size, args.sort_size, args.warmup, args.repeat, args.memory
+        )
+        console.print(results_table(results))
+    path = export_json(results, args.output, metadata)
+    print(f"\nResultados salvos em {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+from collections import Counter
+from dataclasses import dataclass
+
+from core.dp import (
+    _lcs_bitparallel,
+    _levenshtein_banded,
+    _lower_chars,
+    _pattern_masks,
+)
+
+
+@dataclass
+class FilterStats:
+    """Quantos pares cada etapa da cascata de filtros resolveu."""
+
+    length: int = 0
+    histogram: int = 0
+    trim: int = 0
+    exact: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.length + self.histogram + self.trim + self.exact
+
+    def as_dict(self) -> dict:
+        """Retorna as contagens por etapa (e o total) como dicionário."""
+        return {
+            "length": self.length,
+            "histogram": self.histogram,
+            "trim": self.trim,
+            "exact": self.exact,
+            "total": self.total,
+        }
+
+
+def _trim_common(a, b):
+    """Remove o prefixo e o sufixo comuns de ``a`` e ``b``; retorna ``(a, b, comprimento_removido)``."""
+    limit = min(len(a), len(b))
+    prefix = 0
+    while prefix < limit and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and a[-1 - suffix] == b[-1 - suffix]:
+        suffix += 1
+    return a[prefix : len(a) - suffix], b[prefix : len(b) - suffix], prefix + suffix
+
+
+def levenshtein_within(s1, s2, max_distance, stats=None):
+    """
+    Verifica se a distância de Levenshtein é no máximo ``max_distance``.
+
+    Aplica, em ordem, limites baratos e só cai no kernel exato quando eles não decidem:
+
+    1. Diferença de tamanhos (limite inferior) e maior tamanho (limite superior).
+    2. Histograma de caracteres: cada caractere sobrando de um lado exige uma edição.
+    3. Remoção do prefixo e sufixo comuns, que não alteram a distância.
+    4. Distância exata na faixa de Ukkonen (``levenshtein_distance_bounded``).
+
+    Se ``stats`` (``FilterStats``) for informado, a etapa que resolveu o par é contada.
+    """
+    stats = stats if stats is not None else FilterStats()
+    a, b = _lower_chars(s1), _lower_chars(s2)
+    k = max_distance
+
+    if abs(len(a) - len(b)) > k:
+        stats.length += 1
+        return False
+    if max(len(a), len(b)) <= k:
+        stats.length += 1
+        return True
+
+    count_a, count_b = Counter(a), Counter(b)
+    if max(sum((count_a - count_b).values()), sum((count_b - count_a).values())) > k:
+        stats.histogram += 1
+        return False
+
+    a, b, _ = _trim_common(a, b)
+    if not a or not b or max(len(a), len(b)) <= k:
+        stats.trim += 1
+        return max(len(a), len(b)) <= k
+
+    stats.exact += 1
+    return _levenshtein_banded(a, b, k) <= k
+
+
+def lcs_at_least(s1, s2, min_length, stats=None):
+    """
+    Verifica se a maior subsequência comum tem pelo menos ``min_length`` caracteres.
+
+    Aplica, em ordem, limites baratos e só cai no kernel exato quando eles não decidem:
+
+    1. Menor tamanho (limite superior).
+    2. Histograma de caracteres: a LCS não passa da soma dos mínimos de cada caractere.
+    3. Prefixo e sufixo comuns, que entram inteiros na LCS.
+    4. LCS exata bit-paralela do meio restante.
+
+    Se ``stats`` (``FilterStats``) for informado, a etapa que resolveu o par é contada.
+    """
+    stats = stats if stats is not None else FilterStats()
+    a, b = _lower_chars(s1), _lower_chars(s2)
+    k = min_length
+
+    if min(len(a), len(b)) < k:
+        stats.length += 1
+        return False
+    if k <= 0:
+        stats.length += 1
+        return True
+
+    if sum((Counter(a) & Counter(b)).values()) < k:
+        stats.histogram += 1
+        return False
+
+    a, b, common = _trim_common(a, b)
+    if common >= k or not a or not b:
+        stats.trim += 1
+        return common >= k
+
+    stats.exact += 1
+    if len(a) < len(b):
+        a, b = b, a
+    return common + _lcs_bitparallel(_pattern_masks(a), len(a), b) >= k
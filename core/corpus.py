@@ -0,0 +1,104 @@
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import os
+import re
+
+from utils.ingestion import read_text
+
+logger = logging.getLogger(__name__)
+
+# Pasta padrão das respostas: data/llms/{llm}/p{num_prompt}.txt
+DEFAULT_ROOT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "llms"
+)
+
+_PROMPT_FILE = re.compile(r"p(\d+)\.txt")
+
+
+class Corpus:
+    """
+    Respostas das LLMs carregadas em memória, indexadas por ``(modelo, prompt)``.
+    """
+
+    def __init__(self, texts=None):
+        self._texts = dict(texts or {})
+
+    def __len__(self):
+        return len(self._texts)
+
+    def __contains__(self, key):
+        return key in self._texts
+
+    def __getitem__(self, key):
+        return self._texts[key]
+
+    def __iter__(self):
+        return iter(sorted(self._texts))
+
+    def get(self, model, prompt, default=None):
+        """Retorna a resposta de ``model`` para ``prompt`` ou ``default`` se ela não existir."""
+        return self._texts.get((model, prompt), default)
+
+    @property
+    def models(self):
+        """Modelos presentes no corpus, em ordem alfabética."""
+        return sorted({model for model, _ in self._texts})
+
+    @property
+    def prompts(self):
+        """Números dos prompts presentes no corpus, em ordem crescente."""
+        return sorted({prompt for _, prompt in self._texts})
+
+    def texts_for_prompt(self, prompt, models=None):
+        """Retorna ``{modelo: texto}`` com as respostas disponíveis para um prompt."""
+        models = self.models if models is None else models
+        return {
+            model: self._texts[(model, prompt)]
+            for model in models
+            if (model, prompt) in self._texts
+        }
+
+
+def discover_corpus(root=DEFAULT_ROOT):
+    """
+    Encontra todos os arquivos ``<root>/<modelo>/p<N>.txt`` em uma única passada com ``os.scandir``.
+
+    Retorna uma lista de tuplas ``(modelo, prompt, caminho)`` ordenada por modelo e prompt.
+    """
+    found = []
+    with os.scandir(root) as models:
+        for model_entry in models:
+            if not model_entry.is_dir():
+                continue
+            with os.scandir(model_entry.path) as files:
+                for file_entry in files:
+                    match = _PROMPT_FILE.fullmatch(file_entry.name)
+                    if match and file_entry.is_file():
+                        found.append(
+                            (model_entry.name, int(match.group(1)), file_entry.path)
+                        )
+    found.sort()
+    return found
+
+
+def load_corpus(root=DEFAULT_ROOT, reader=read_text, max_workers=32):
+    """
+    Descobre e carrega todas as respostas de ``root`` concorrentemente em um pool de threads.
+
+    ``reader`` recebe o caminho e retorna o texto (ou ``None`` em caso de erro, como
+    ``ler_arquivo``). Arquivos que não puderam ser lidos ficam fora do corpus. Como a
+    leitura é dominada pela latência de I/O, as threads se sobrepõem mesmo com o GIL.
+    """
+    entries = discover_corpus(root)
+
+    def load(entry):
+        model, prompt, path = entry
+        try:
+            return (model, prompt), reader(path)
+        except Exception as e:
+            logger.error(f"Error loading {path}: {e}")
+            return (model, prompt), None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        loaded = executor.map(load, entries)
+        return Corpus({key: text for key, text in loaded if text is not None})
@@ -0,0 +1,108 @@
+from core.dp import _lower_chars
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional; core.dp usa o backend em Python puro.
+    np = None
+
+HAS_NUMPY = np is not None
+
+
+def _encode(chars, codes):
+    """
+    Codifica caracteres já convertidos para minúsculo como um array ``uint32``.
+
+    Usa o code point quando o caractere minúsculo tem tamanho 1; caracteres que viram
+    mais de um code point (ex.: 'İ') recebem um código acima de 0x10FFFF, compartilhado
+    entre as duas strings através de ``codes``.
+    """
+    encoded = np.empty(len(chars), dtype=np.uint32)
+    for idx, c in enumerate(chars):
+        if len(c) == 1:
+            encoded[idx] = ord(c)
+        else:
+            encoded[idx] = codes.setdefault(c, 0x110000 + len(codes))
+    return encoded
+
+
+def _prepare(s1, s2):
+    """Codifica as duas strings, deixando em ``a`` a mais curta (percorrida em Python)."""
+    codes = {}
+    a = _encode(_lower_chars(s1), codes)
+    b = _encode(_lower_chars(s2), codes)
+    if len(a) > len(b):
+        a, b = b, a
+    return a, b
+
+
+def longest_common_subsequence_numpy(s1, s2):
+    """
+    Calcula o comprimento da maior subsequência comum com linhas vetorizadas em NumPy.
+
+    Cada linha usa o truque do máximo de prefixo: ``dp[i][j] = max(t[0..j])`` com
+    ``t[j] = max(dp[i-1][j], dp[i-1][j-1] + igual)``, então a dependência horizontal
+    vira um único ``np.maximum.accumulate``.
+
+    Complexidade de tempo: O(m * n), com O(min(m, n)) passos em Python
+    Complexidade de espaço: O(max(m, n))
+    """
+    a, b = _prepare(s1, s2)
+    n = len(b)
+    prev = np.zeros(n + 1, dtype=np.int32)
+    t = np.zeros(n + 1, dtype=np.int32)
+
+    for ca in a:
+        np.maximum(prev[1:], prev[:-1] + (b == ca), out=t[1:])
+        prev = np.maximum.accumulate(t)
+
+    return int(prev[n])
+
+
+def longest_common_substring_numpy(s1, s2):
+    """
+    Calcula o comprimento da maior substring comum com linhas vetorizadas em NumPy.
+
+    Complexidade de tempo: O(m * n), com O(min(m, n)) passos em Python
+    Complexidade de espaço: O(max(m, n))
+    """
+    a, b = _prepare(s1, s2)
+    n = len(b)
+    prev = np.zeros(n + 1, dtype=np.int32)
+    curr = np.zeros(n + 1, dtype=np.int32)
+    max_length = 0
+
+    for ca in a:
+        np.multiply(prev[:-1] + 1, b == ca, out=curr[1:])
+        row_max = int(curr.max()) if n else 0
+        if row_max > max_length:
+            max_length = row_max
+        prev, curr = curr, prev
+
+    return max_length
+
+
+def levenshtein_distance_numpy(s1, s2):
+    """
+    Calcula a distância de Levenshtein com linhas vetorizadas em NumPy.
+
+    Cada linha usa o truque do mínimo de prefixo: com ``t[j] = min(dp[i-1][j] + 1,
+    dp[i-1][j-1] + custo)``, a inserção vira ``dp[i][j] = j + min(t[k] - k, k <= j)``,
+    calculado por um único ``np.minimum.accumulate``.
+
+    Complexidade de tempo: O(m * n), com O(min(m, n)) passos em Python
+    Complexidade de espaço: O(max(m, n))
+    """
+    a, b = _prepare(s1, s2)
+    n = len(b)
+    offsets = np.arange(n + 1, dtype=np.int32)
+    prev = offsets.copy()
+    t = np.empty(n + 1, dtype=np.int32)
+
+    for i, ca in enumerate(a, start=1):
+        t[0] = i
+        np.minimum(prev[1:] + 1, prev[:-1] + (b != ca), out=t[1:])
+        t -= offsets
+        prev = np.minimum.accumulate(t)
+        prev += offsets
+
+    return int(prev[n])
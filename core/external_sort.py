@@ -0,0 +1,156 @@
+from array import array
+from itertools import islice
+import heapq
+import os
+import tempfile
+
+# Memória padrão (em bytes) para os blocos ordenados em memória e os buffers do merge.
+DEFAULT_MAX_MEMORY = 64 * 1024 * 1024
+
+# Quantas runs são intercaladas de uma vez no merge k-way.
+DEFAULT_FAN_IN = 64
+
+# Custo aproximado, em bytes, de cada valor enquanto o bloco é ordenado em memória:
+# ponteiro na lista mais o objeto ``int``/``float`` do Python.
+_BOXED_ITEM_BYTES = 40
+
+
+def iter_binary(path, typecode="d", buffer_items=64 * 1024):
+    """Lê um arquivo binário de valores ``typecode`` (``array``) aos poucos, ``buffer_items`` por vez."""
+    with open(path, "rb") as f:
+        while True:
+            block = array(typecode)
+            try:
+                block.fromfile(f, buffer_items)
+            except EOFError:
+                # ``fromfile`` guarda os itens lidos antes de chegar ao fim do arquivo.
+                yield from block
+                return
+            yield from block
+
+
+def write_binary(values, path, typecode="d", buffer_items=64 * 1024):
+    """Grava os valores de um iterável em um arquivo binário ``typecode``; retorna quantos foram gravados."""
+    count = 0
+    values = iter(values)
+    with open(path, "wb") as f:
+        while block := array(typecode, islice(values, buffer_items)):
+            block.tofile(f)
+            count += len(block)
+    return count
+
+
+def _spill_runs(values, typecode, chunk_items, directory):
+    """
+    Ordena ``values`` em blocos de ``chunk_items`` e grava cada bloco como uma run binária.
+
+    Retorna ``(caminhos, ultimo_bloco)``: se tudo coube em um único bloco, nada é
+    gravado e o bloco ordenado é retornado para evitar o disco.
+    """
+    paths = []
+    values = iter(values)
+    while chunk := array(typecode, sorted(islice(values, chunk_items))):
+        if not paths and len(chunk) < chunk_items:
+            return paths, chunk
+        path = os.path.join(directory, f"run-{len(paths)}.bin")
+        with open(path, "wb") as f:
+            chunk.tofile(f)
+        paths.append(path)
+    return paths, None
+
+
+def external_sort(
+    values,
+    typecode="d",
+    max_memory=DEFAULT_MAX_MEMORY,
+    fan_in=DEFAULT_FAN_IN,
+    temp_dir=None,
+):
+    """
+    Ordena um iterável de números maior que a memória disponível (merge sort externo).
+    Retorna um iterador com os valores em ordem crescente.
+
+    Os valores são lidos em blocos que cabem em ``max_memory`` bytes, cada bloco é
+    ordenado em memória e gravado como uma run binária (``array`` com ``typecode``) em
+    um diretório temporário. As runs são intercaladas com um heap, no máximo
+    ``fan_in`` por vez; se houver mais runs, passadas intermediárias geram runs
+    maiores até sobrar no máximo ``fan_in``. Os arquivos temporários são apagados ao
+    final da iteração (ou quando o iterador é fechado).
+
+    Os argumentos são validados já na chamada, antes de a iteração começar.
+
+    Complexidade de Tempo: O(n log n), com O(n log_fan_in(n / bloco)) de I/O em disco.
+    Complexidade de Espaço: O(max_memory) em memória, O(n) em disco.
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in deve ser maior ou igual a 2")
+    return _external_sort(values, typecode, max_memory, fan_in, temp_dir)
+
+
+def _external_sort(values, typecode, max_memory, fan_in, temp_dir):
+    """Gerador com o merge sort externo de ``external_sort`` (argumentos já validados)."""
+    itemsize = array(typecode).itemsize
+    chunk_items = max(1, max_memory // (itemsize + _BOXED_ITEM_BYTES))
+    # Na intercalação, a memória é dividida entre os buffers de leitura das runs.
+    buffer_items = max(1, max_memory // itemsize // (fan_in + 1))
+
+    with tempfile.TemporaryDirectory(
+        prefix="external_sort-", dir=temp_dir
+    ) as directory:
+        runs, in_memory = _spill_runs(values, typecode, chunk_items, directory)
+        if in_memory is not None:
+            yield from in_memory
+            return
+
+        generation = 0
+        while len(runs) > fan_in:
+            generation += 1
+            merged = []
+            for start in range(0, len(runs), fan_in):
+                group = runs[start : start + fan_in]
+                path = os.path.join(directory, f"merge-{generation}-{len(merged)}.bin")
+                write_binary(
+                    heapq.merge(
+                        *(iter_binary(run, typecode, buffer_items) for run in group)
+                    ),
+                    path,
+                    typecode,
+                    buffer_items,
+                )
+                for run in group:
+                    os.remove(run)
+                merged.append(path)
+            runs = merged
+
+        yield from heapq.merge(
+            *(iter_binary(run, typecode, buffer_items) for run in runs)
+        )
+
+
+def external_sort_file(
+    input_path,
+    output_path,
+    typecode="d",
+    max_memory=DEFAULT_MAX_MEMORY,
+    fan_in=DEFAULT_FAN_IN,
+    temp_dir=None,
+):
+    """
+    Ordena um arquivo binário de valores ``typecode`` e grava o resultado em ``output_path``.
+
+    Retorna quantos valores foram gravados.
+    """
+    itemsize = array(typecode).itemsize
+    buffer_items = max(1, max_memory // itemsize // (fan_in + 1))
+    return write_binary(
+        external_sort(
+            iter_binary(input_path, typecode, buffer_items),
+            typecode,
+            max_memory,
+            fan_in,
+            temp_dir,
+        ),
+        output_path,
+        typecode,
+        buffer_items,
+    )
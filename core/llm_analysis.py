@@ -1,6 +1,6 @@
-import statistics
+import functools
+import itertools
 import sys
-import os
 from rich.console import Console
 from rich.table import Table
 from rich.text import Text
@@ -11,6 +11,11 @@ from core.dp import (
     longest_common_substring_iter,
     levenshtein_distance_iter,
 )
+from core.running_stats import RunningStats
+from core.corpus import load_corpus
+from core.pipeline import RichTableSink, distance_pipeline
+from utils.cache.distance_cache import DistanceCache
+from utils.ingestion import TruncationPolicy, read_text
 
 # Prompts usados para gerar respostas das LLMs. Cada prompt tem um arquivo de resposta para cada LLM na pasta data/llms/{llm}/p{num_prompt}.txt
 prompts = {
@@ -37,11 +42,15 @@ prompts = {
 }
 
 
-def ler_arquivo(path):
-    """Lê o conteúdo de um arquivo com tratamento de erro."""
+def ler_arquivo(path, policy=TruncationPolicy.PREFIX, limit=100, offset=0):
+    """
+    Lê o conteúdo de um arquivo com tratamento de erro.
+
+    Por padrão lê só os primeiros 100 caracteres; use ``policy`` (prefixo, janela ou
+    arquivo inteiro), ``limit`` e ``offset`` para escolher o trecho comparado.
+    """
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return f.read(100)
+        return read_text(path, policy, limit, offset)
     except FileNotFoundError:
         rprint(
             f"[bold red]ERRO: Arquivo não encontrado:[/bold red] [yellow]{path}[/yellow]",
@@ -54,62 +63,97 @@ def ler_arquivo(path):
 
 
 def calcular_distancias(
-    llms, num_prompts, ler_arquivo_func, algorithm=levenshtein_distance_iter
+    llms,
+    num_prompts,
+    ler_arquivo_func,
+    algorithm=levenshtein_distance_iter,
+    workers=None,
+    cache=None,
+    corpus=None,
+    on_result=None,
+    guardar_resultados=None,
 ):
-    """Calcula as distâncias de Levenshtein entre pares de LLMs para cada prompt."""
-    pares = [
-        (llms[0], llms[1]),
-        (llms[0], llms[2]),
-        (llms[1], llms[2]),
-    ]
-    all_distances = {f"{l1}-{l2}": [] for l1, l2 in pares}
-    resultados = []
-
-    for i in range(1, num_prompts + 1):
-        conteudos = {}
-        llms_ok = True
-
-        for llm in llms:
-            filename = f"p{i}.txt"
-            filepath = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-                "data",
-                "llms",
-                llm,
-                filename,
-            )
-            conteudos[llm] = ler_arquivo_func(filepath)
+    """
+    Calcula as distâncias entre todos os pares de LLMs para cada prompt.
+
+    Os prompts passam um a um pelo pipeline de ``core/pipeline.py`` (descoberta,
+    leitura, cache, comparação e agregação), até o prompt ``num_prompts``. Cada resposta é pré-processada uma única
+    vez por prompt e reaproveitada em todos os pares em que aparece. Com ``workers``
+    maior que 1, os prompts são distribuídos em lotes por um ``ProcessPoolExecutor``;
+    a ordem dos resultados continua a mesma da execução serial. Com um
+    ``DistanceCache`` em ``cache``, só os pares que não estão no cache são calculados.
+    Os textos vêm do ``Corpus`` em ``corpus``; sem ele, o corpus é carregado com
+    ``load_corpus`` usando ``ler_arquivo_func`` como leitor.
+
+    As distâncias de cada par de LLMs alimentam um ``RunningStats`` à medida que cada
+    prompt termina, em vez de ficarem guardadas em listas. Se ``on_result`` for
+    informado, ele é chamado com ``(prompt, distancias, agregados)`` a cada prompt,
+    o que permite mostrar resultados parciais durante execuções longas.
 
-            if conteudos[llm] is None:
-                llms_ok = False
-                break
+    Retorna ``(pares, agregados, resultados)``. Por padrão, a lista ``resultados`` só
+    é montada quando não há ``on_result`` (que já consome cada prompt); caso contrário
+    ela vem como ``None`` e a memória não cresce com o número de prompts. Use
+    ``guardar_resultados`` para forçar um ou outro comportamento.
+    """
+    pares = list(itertools.combinations(llms, 2))
+    agregados = {f"{l1}-{l2}": RunningStats() for l1, l2 in pares}
+    if guardar_resultados is None:
+        guardar_resultados = on_result is None
+    resultados = [] if guardar_resultados else None
+    if corpus is None:
+        corpus = load_corpus(reader=ler_arquivo_func)
 
-        if not llms_ok:
-            resultados.append((i, None))
-            continue
+    for i, distancias in distance_pipeline(
+        corpus,
+        llms,
+        algorithm,
+        agregados,
+        workers,
+        cache,
+        num_prompts,
+    ):
+        if resultados is not None:
+            resultados.append((i, distancias))
+        if on_result is not None:
+            on_result(i, distancias, agregados)
 
-        distancias = {}
-        for l1, l2 in pares:
-            dist = algorithm(conteudos[l1], conteudos[l2])
-            chave = f"{l1}-{l2}"
-            all_distances[chave].append(dist)
-            distancias[chave] = dist
+    return pares, agregados, resultados
 
-        resultados.append((i, distancias))
 
-    return pares, all_distances, resultados
+def _linha_distancias(pares, i, distancias):
+    """Células da linha de um prompt na tabela de distâncias."""
+    if distancias is None:
+        return [
+            f"P{i}",
+            Text("ERRO DE ARQUIVO", style="bold red", justify="center"),
+            *([""] * (len(pares) - 1)),
+        ]
+    return [f"P{i}", *(f"{distancias[f'{l1}-{l2}']}" for l1, l2 in pares)]
 
 
-def exibir_tabela_distancias(pares, resultados, algorithm=levenshtein_distance_iter):
+def descrever_trecho(policy=TruncationPolicy.PREFIX, limit=100, offset=0):
+    """Descrição curta do trecho comparado, usada nos títulos das tabelas."""
+    policy = TruncationPolicy(policy)
+    if policy is TruncationPolicy.FULL:
+        return "Texto completo"
+    if policy is TruncationPolicy.WINDOW:
+        return f"Chars {offset} a {offset + limit}"
+    return f"Primeiros {limit} chars"
+
+
+def exibir_tabela_distancias(
+    pares, resultados, algorithm=levenshtein_distance_iter, trecho=None
+):
     """Exibe a tabela de distâncias para cada prompt, usando o algoritmo especificado."""
+    trecho = trecho or descrever_trecho()
     if algorithm == levenshtein_distance_iter:
-        title = "Distâncias de Levenshtein (Primeiros 100 chars)"
+        title = f"Distâncias de Levenshtein ({trecho})"
     elif algorithm == longest_common_subsequence_iter:
-        title = "Subsequência Comum Mais Longa (Primeiros 100 chars)"
+        title = f"Subsequência Comum Mais Longa ({trecho})"
     elif algorithm == longest_common_substring_iter:
-        title = "Substring Comum Mais Longa (Primeiros 100 chars)"
+        title = f"Substring Comum Mais Longa ({trecho})"
     else:
-        title = "Comparação de Respostas (Primeiros 100 chars)"
+        title = f"Comparação de Respostas ({trecho})"
 
     table = Table(title=title, show_lines=True)
     table.add_column("Prompt", style="cyan", justify="center")
@@ -119,43 +163,44 @@ def exibir_tabela_distancias(pares, resultados, algorithm=levenshtein_distance_i
         )
 
     for i, distancias in resultados:
-        if distancias is None:
-            table.add_row(
-                f"P{i}",
-                Text("ERRO DE ARQUIVO", style="bold red", justify="center"),
-                *([""] * (len(pares) - 1)),
-            )
-        else:
-            row_data = [f"P{i}"]
-            for l1, l2 in pares:
-                chave = f"{l1}-{l2}"
-                row_data.append(f"{distancias[chave]}")
-            table.add_row(*row_data)
+        table.add_row(*_linha_distancias(pares, i, distancias))
     return table
 
 
-def exibir_tabela_medias(all_distances):
-    """Exibe a tabela de médias e medianas das distâncias."""
+def exibir_tabela_medias(agregados):
+    """
+    Exibe a tabela de médias, medianas, desvios e faixas das distâncias.
+
+    ``agregados`` mapeia cada par ``"llm1-llm2"`` para um ``RunningStats`` (ou para
+    uma lista de distâncias, que é agregada na hora).
+    """
     avg_table = Table(show_header=True, show_lines=True, padding=(0, 2))
     avg_table.add_column("Comparação", style="cyan")
     avg_table.add_column("Média da Distância", justify="right", style="yellow")
     avg_table.add_column("Mediana da Distância", justify="right", style="yellow")
+    avg_table.add_column("Desvio Padrão", justify="right", style="yellow")
+    avg_table.add_column("Mín–Máx", justify="right", style="yellow")
 
-    for chave, distancias in all_distances.items():
+    for chave, estatisticas in agregados.items():
         l1, l2 = chave.split("-")
-        if distancias:
-            media = sum(distancias) / len(distancias)
-            mediana = statistics.median(distancias)
+        if not isinstance(estatisticas, RunningStats):
+            lista, estatisticas = estatisticas, RunningStats()
+            estatisticas.update(lista)
+        if estatisticas.count:
             avg_table.add_row(
                 f"{l1.capitalize()} vs {l2.capitalize()}",
-                f"{media:.2f}",
-                f"{mediana:.2f}",
+                f"{estatisticas.mean:.2f}",
+                f"{estatisticas.median:.2f}",
+                f"{estatisticas.stddev:.2f}",
+                f"{estatisticas.min}–{estatisticas.max}",
             )
         else:
             avg_table.add_row(
                 f"{l1.capitalize()} vs {l2.capitalize()}",
                 "[bold red]N/A (nenhum dado)[/bold red]",
                 "",
+                "",
+                "",
             )
     return avg_table
 
@@ -169,10 +214,24 @@ def show_llm_prompts():
         rprint("")  # Linha em branco entre categorias
 
 
-def compare_llm_responses(algorithm=levenshtein_distance_iter):
+def compare_llm_responses(
+    algorithm=levenshtein_distance_iter,
+    workers=None,
+    policy=TruncationPolicy.PREFIX,
+    limit=100,
+    offset=0,
+):
+    """
+    Compara as respostas de todas as LLMs e exibe as tabelas por prompt e gerais.
+
+    ``policy``, ``limit`` e ``offset`` escolhem o trecho de cada resposta que é
+    comparado (veja ``ler_arquivo``); o padrão são os primeiros 100 caracteres.
+    """
     console = Console()
-    llms = ["chatgpt", "deepseek", "gemini"]
-    num_prompts = 10
+    leitor = functools.partial(ler_arquivo, policy=policy, limit=limit, offset=offset)
+    corpus = load_corpus(reader=leitor)
+    llms = corpus.models
+    num_prompts = max(corpus.prompts, default=0)
 
     if algorithm == levenshtein_distance_iter:
         text = "\n\n[bold green]📊 Tabela de Distâncias de Levenshtein Prompt a Prompt[/bold green]\n"
@@ -187,11 +246,29 @@ def compare_llm_responses(algorithm=levenshtein_distance_iter):
 
     rprint(text)
 
-    pares, all_distances, resultados = calcular_distancias(
-        llms, num_prompts, ler_arquivo, algorithm
+    # A tabela é desenhada ao vivo: cada prompt aparece assim que é comparado.
+    pares = list(itertools.combinations(llms, 2))
+    table = exibir_tabela_distancias(
+        pares, [], trecho=descrever_trecho(policy, limit, offset)
     )
-    table = exibir_tabela_distancias(pares, resultados)
-    console.print(table)
+    with (
+        DistanceCache() as cache,
+        RichTableSink(
+            table,
+            lambda i, distancias: _linha_distancias(pares, i, distancias),
+            console,
+        ) as sink,
+    ):
+        pares, agregados, _ = calcular_distancias(
+            llms,
+            num_prompts,
+            ler_arquivo,
+            algorithm,
+            workers,
+            cache,
+            corpus,
+            on_result=lambda i, distancias, agregados: sink.write(i, distancias),
+        )
 
     if algorithm == levenshtein_distance_iter:
         rprint("\n\n[bold green]🏆 Distâncias de Levenshtein Gerais[/bold green]\n")
@@ -202,5 +279,5 @@ def compare_llm_responses(algorithm=levenshtein_distance_iter):
     elif algorithm == longest_common_substring_iter:
         rprint("\n\n[bold green]🏆 Substrings Comuns Mais Longas Gerais[/bold green]\n")
 
-    avg_table = exibir_tabela_medias(all_distances)
+    avg_table = exibir_tabela_medias(agregados)
     console.print(avg_table)
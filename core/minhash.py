@@ -0,0 +1,161 @@
+import hashlib
+import random
+
+from core.batch import PreparedText, prepared_kernel
+from core.dp import _lower_chars, levenshtein_distance_iter
+
+# Primo de Mersenne 2^61 - 1, usado no hashing universal das permutações.
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+def shingles(text, n=5):
+    """
+    Retorna o conjunto de n-gramas de caracteres (em minúsculo) do texto.
+
+    Textos menores que ``n`` viram um único shingle com o texto inteiro.
+    """
+    folded = "".join(_lower_chars(text))
+    if len(folded) < n:
+        return {folded} if folded else set()
+    return {folded[i : i + n] for i in range(len(folded) - n + 1)}
+
+
+def jaccard(a, b):
+    """Similaridade de Jaccard entre dois conjuntos (1.0 para dois conjuntos vazios)."""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def _shingle_hash(shingle):
+    """Hash estável de 64 bits (o ``hash`` do Python muda a cada processo)."""
+    return int.from_bytes(
+        hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big"
+    )
+
+
+class MinHasher:
+    """
+    Gera assinaturas MinHash com ``num_perm`` permutações simuladas por hashing universal.
+
+    A fração de posições iguais entre duas assinaturas estima a similaridade de
+    Jaccard entre os conjuntos de shingles.
+    """
+
+    def __init__(self, num_perm=128, seed=1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._params = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, shingle_set):
+        """Retorna a assinatura (tupla de ``num_perm`` mínimos) de um conjunto de shingles."""
+        if not shingle_set:
+            return (_MERSENNE_PRIME,) * self.num_perm
+        hashes = [_shingle_hash(s) for s in shingle_set]
+        return tuple(
+            min((a * x + b) % _MERSENNE_PRIME for x in hashes) for a, b in self._params
+        )
+
+
+def estimate_jaccard(sig_a, sig_b):
+    """Estima a similaridade de Jaccard pela fração de posições iguais das assinaturas."""
+    return sum(x == y for x, y in zip(sig_a, sig_b)) / len(sig_a)
+
+
+def _optimal_bands(threshold, num_perm):
+    """
+    Escolhe ``(bandas, linhas)`` com ``bandas * linhas <= num_perm`` cujo ponto de
+    virada da curva-S, ``(1 / bandas) ** (1 / linhas)``, fica mais perto de ``threshold``.
+    """
+    best = (1, num_perm)
+    best_error = float("inf")
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+class LSHIndex:
+    """
+    Índice LSH (banding) sobre assinaturas MinHash.
+
+    Pares que caem no mesmo bucket em pelo menos uma banda viram candidatos; pares
+    com Jaccard bem abaixo de ``threshold`` raramente colidem.
+    """
+
+    def __init__(self, threshold=0.5, num_perm=128):
+        self.threshold = threshold
+        self.bands, self.rows = _optimal_bands(threshold, num_perm)
+        self._buckets = [{} for _ in range(self.bands)]
+
+    def _band_keys(self, signature):
+        for band in range(self.bands):
+            start = band * self.rows
+            yield band, signature[start : start + self.rows]
+
+    def insert(self, key, signature):
+        """Adiciona ``key`` ao índice com a sua assinatura."""
+        for band, band_key in self._band_keys(signature):
+            self._buckets[band].setdefault(band_key, []).append(key)
+
+    def query(self, signature):
+        """Retorna o conjunto de chaves que colidem com a assinatura em alguma banda."""
+        found = set()
+        for band, band_key in self._band_keys(signature):
+            found.update(self._buckets[band].get(band_key, ()))
+        return found
+
+    def candidate_pairs(self):
+        """Retorna o conjunto de pares ``(a, b)`` de chaves que colidiram em alguma banda."""
+        pairs = set()
+        for buckets in self._buckets:
+            for keys in buckets.values():
+                for i in range(len(keys)):
+                    for j in range(i + 1, len(keys)):
+                        pairs.add((keys[i], keys[j]))
+        return pairs
+
+
+def near_duplicate_pairs(
+    texts,
+    threshold=0.5,
+    algorithm=levenshtein_distance_iter,
+    ngram=5,
+    num_perm=128,
+    seed=1,
+):
+    """
+    Compara apenas os pares de textos que provavelmente são parecidos.
+
+    Os textos são quebrados em shingles de ``ngram`` caracteres, recebem assinaturas
+    MinHash e são agrupados por LSH. Só os pares candidatos com Jaccard dos shingles
+    maior ou igual a ``threshold`` passam pelo algoritmo exato.
+
+    Retorna uma lista ordenada de tuplas ``(i, j, jaccard, valor)`` com ``i < j``.
+
+    Complexidade de tempo: O(N) assinaturas + O(candidatos) comparações exatas,
+    em vez de O(N²) comparações exatas
+    """
+    hasher = MinHasher(num_perm, seed)
+    index = LSHIndex(threshold, num_perm)
+    shingle_sets = [shingles(text, ngram) for text in texts]
+    for i, shingle_set in enumerate(shingle_sets):
+        index.insert(i, hasher.signature(shingle_set))
+
+    kernel = prepared_kernel(algorithm)
+    prepared = {}
+    results = []
+    for i, j in sorted(index.candidate_pairs()):
+        similarity = jaccard(shingle_sets[i], shingle_sets[j])
+        if similarity < threshold:
+            continue
+        for k in (i, j):
+            if k not in prepared:
+                prepared[k] = PreparedText(texts[k])
+        results.append((i, j, similarity, kernel(prepared[i], prepared[j])))
+    return results
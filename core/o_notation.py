@@ -1,3 +1,9 @@
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from itertools import chain
+import heapq
+
+
 def insertion_sort(data):
     """
     Ordena uma lista de números usando o algoritmo Insertion Sort.
@@ -52,18 +58,608 @@ def merge_sort(data):
     return merged_list
 
 
+def _merge_pass(src, dst, width, n, src_values=None, dst_values=None):
+    """
+    Intercala os pares de blocos vizinhos de tamanho ``width`` de ``src`` em ``dst``.
+
+    Se ``src_values`` for informado, os valores acompanham as chaves de ``src`` e são
+    movidos para ``dst_values`` nas mesmas posições.
+    """
+    for lo in range(0, n, 2 * width):
+        mid = min(lo + width, n)
+        hi = min(lo + 2 * width, n)
+        i, j, k = lo, mid, lo
+        while i < mid and j < hi:
+            if src[j] < src[i]:
+                dst[k] = src[j]
+                if src_values is not None:
+                    dst_values[k] = src_values[j]
+                j += 1
+            else:
+                dst[k] = src[i]
+                if src_values is not None:
+                    dst_values[k] = src_values[i]
+                i += 1
+            k += 1
+
+        # Só um dos lados ainda tem elementos.
+        if i < mid:
+            dst[k:hi] = src[i:mid]
+            if src_values is not None:
+                dst_values[k:hi] = src_values[i:mid]
+        else:
+            dst[k:hi] = src[j:hi]
+            if src_values is not None:
+                dst_values[k:hi] = src_values[j:hi]
+
+
+def bottom_up_merge_sort(data, key=None):
+    """
+    Ordena uma lista usando o Merge Sort iterativo (bottom-up), sem recursão.
+    Retorna uma nova lista ordenada (estável).
+
+    Intercala blocos de tamanho 1, 2, 4, ... trabalhando só com índices, alternando
+    entre a cópia dos dados e um único buffer auxiliar (ping-pong), em vez de criar
+    novas listas a cada chamada. Com ``key``, a chave de cada elemento é calculada uma
+    única vez (decorate-sort-undecorate) e os valores acompanham as chaves.
+
+    Complexidade de Tempo: O(n log n) em todos os casos.
+    Complexidade de Espaço: O(n), dois buffers de n posições (quatro com ``key``).
+    """
+    n = len(data)
+    if key is None:
+        src, src_values = data[:], None
+    else:
+        src, src_values = [key(item) for item in data], data[:]
+    if n < 2:
+        return src if src_values is None else src_values
+
+    dst = [None] * n
+    dst_values = None if src_values is None else [None] * n
+    width = 1
+    while width < n:
+        _merge_pass(src, dst, width, n, src_values, dst_values)
+        src, dst = dst, src
+        src_values, dst_values = dst_values, src_values
+        width *= 2
+
+    return src if src_values is None else src_values
+
+
+# Tamanho mínimo de run do hybrid_sort: runs naturais menores são completadas com
+# insertion sort binário até ``_min_run(n)`` elementos (entre MIN_MERGE/2 e MIN_MERGE).
+MIN_MERGE = 64
+
+# Quantas vitórias seguidas de um mesmo lado disparam o galloping no merge.
+MIN_GALLOP = 7
+
+
+def _min_run(n):
+    """Calcula o tamanho mínimo de run como no Timsort (entre MIN_MERGE/2 e MIN_MERGE)."""
+    extra = 0
+    while n >= MIN_MERGE:
+        extra |= n & 1
+        n >>= 1
+    return n + extra
+
+
+def _binary_insertion_sort(a, lo, hi, start):
+    """Ordena ``a[lo:hi]`` sabendo que ``a[lo:start]`` já está ordenado."""
+    for i in range(start, hi):
+        value = a[i]
+        position = bisect_right(a, value, lo, i)
+        if position != i:
+            a[position + 1 : i + 1] = a[position:i]
+            a[position] = value
+
+
+def _count_run(a, lo, hi):
+    """
+    Retorna o tamanho da run natural que começa em ``lo``.
+
+    Runs estritamente decrescentes são invertidas no lugar (o "estritamente" mantém a
+    ordenação estável).
+    """
+    run_hi = lo + 1
+    if run_hi == hi:
+        return 1
+    if a[run_hi] < a[lo]:
+        while run_hi + 1 < hi and a[run_hi + 1] < a[run_hi]:
+            run_hi += 1
+        a[lo : run_hi + 1] = a[lo : run_hi + 1][::-1]
+    else:
+        while run_hi + 1 < hi and not a[run_hi + 1] < a[run_hi]:
+            run_hi += 1
+    return run_hi + 1 - lo
+
+
+def _merge_lo(a, lo, mid, hi, buffer):
+    """Intercala ``a[lo:mid]`` (a run menor, copiada para ``buffer``) com ``a[mid:hi]``."""
+    left_len = mid - lo
+    buffer[:left_len] = a[lo:mid]
+    i, j, k = 0, mid, lo
+    left_wins = right_wins = 0
+
+    while i < left_len and j < hi:
+        if a[j] < buffer[i]:
+            a[k] = a[j]
+            j += 1
+            right_wins += 1
+            left_wins = 0
+        else:
+            a[k] = buffer[i]
+            i += 1
+            left_wins += 1
+            right_wins = 0
+        k += 1
+
+        if left_wins >= MIN_GALLOP and j < hi:
+            end = bisect_right(buffer, a[j], i, left_len)
+            a[k : k + end - i] = buffer[i:end]
+            k += end - i
+            i = end
+            left_wins = 0
+        elif right_wins >= MIN_GALLOP and i < left_len:
+            end = bisect_left(a, buffer[i], j, hi)
+            a[k : k + end - j] = a[j:end]
+            k += end - j
+            j = end
+            right_wins = 0
+
+    a[k : k + left_len - i] = buffer[i:left_len]
+
+
+def _merge_hi(a, lo, mid, hi, buffer):
+    """Intercala ``a[lo:mid]`` com ``a[mid:hi]`` (a run menor, copiada para ``buffer``) a partir do fim."""
+    right_len = hi - mid
+    buffer[:right_len] = a[mid:hi]
+    i, j, k = mid - 1, right_len - 1, hi - 1
+    left_wins = right_wins = 0
+
+    while i >= lo and j >= 0:
+        if buffer[j] < a[i]:
+            a[k] = a[i]
+            i -= 1
+            left_wins += 1
+            right_wins = 0
+        else:
+            a[k] = buffer[j]
+            j -= 1
+            right_wins += 1
+            left_wins = 0
+        k -= 1
+
+        if left_wins >= MIN_GALLOP and i >= lo:
+            start = bisect_right(a, buffer[j], lo, i + 1)
+            count = i + 1 - start
+            a[k - count + 1 : k + 1] = a[start : i + 1]
+            k -= count
+            i = start - 1
+            left_wins = 0
+        elif right_wins >= MIN_GALLOP and j >= 0:
+            start = bisect_left(buffer, a[i], 0, j + 1)
+            count = j + 1 - start
+            a[k - count + 1 : k + 1] = buffer[start : j + 1]
+            k -= count
+            j = start - 1
+            right_wins = 0
+
+    a[k - j : k + 1] = buffer[: j + 1]
+
+
+def _merge_runs(a, lo, mid, hi, buffer):
+    """Intercala as runs vizinhas ``a[lo:mid]`` e ``a[mid:hi]``."""
+    # Elementos do início da run esquerda e do fim da run direita já estão no lugar.
+    lo = bisect_right(a, a[mid], lo, mid)
+    if lo == mid:
+        return
+    hi = bisect_left(a, a[mid - 1], mid, hi)
+
+    if mid - lo <= hi - mid:
+        _merge_lo(a, lo, mid, hi, buffer)
+    else:
+        _merge_hi(a, lo, mid, hi, buffer)
+
+
+def hybrid_sort(data):
+    """
+    Ordena uma lista usando um sort híbrido no estilo do Timsort.
+    Retorna uma nova lista ordenada (estável).
+
+    Detecta runs naturais (crescentes, ou estritamente decrescentes e invertidas),
+    completa as runs curtas com insertion sort binário e intercala as runs com
+    galloping, usando um único buffer auxiliar alocado no início.
+
+    Complexidade de Tempo: O(n log n) no pior caso, O(n) para entradas ordenadas,
+    reversas ou quase ordenadas.
+    Complexidade de Espaço: O(n)
+    """
+    a = data[:]
+    n = len(a)
+    if n < 2:
+        return a
+
+    buffer = [None] * (n // 2 + 1)
+    min_run = _min_run(n)
+    runs = []  # Pilha de (início, tamanho) das runs ainda não intercaladas.
+
+    def merge_at(idx):
+        base, length = runs[idx]
+        next_base, next_length = runs[idx + 1]
+        _merge_runs(a, base, next_base, next_base + next_length, buffer)
+        runs[idx] = (base, length + next_length)
+        del runs[idx + 1]
+
+    lo = 0
+    while lo < n:
+        run_len = _count_run(a, lo, n)
+        if run_len < min_run:
+            forced = min(min_run, n - lo)
+            _binary_insertion_sort(a, lo, lo + forced, lo + run_len)
+            run_len = forced
+        runs.append((lo, run_len))
+        lo += run_len
+
+        # Mantém os invariantes do Timsort: cada run é maior que a soma das duas seguintes.
+        while len(runs) > 1:
+            idx = len(runs) - 2
+            if (idx > 0 and runs[idx - 1][1] <= runs[idx][1] + runs[idx + 1][1]) or (
+                idx > 1 and runs[idx - 2][1] <= runs[idx - 1][1] + runs[idx][1]
+            ):
+                if runs[idx - 1][1] < runs[idx + 1][1]:
+                    idx -= 1
+            elif runs[idx][1] > runs[idx + 1][1]:
+                break
+            merge_at(idx)
+
+    while len(runs) > 1:
+        idx = len(runs) - 2
+        if idx > 0 and runs[idx - 1][1] < runs[idx + 1][1]:
+            idx -= 1
+        merge_at(idx)
+
+    return a
+
+
+# Bits por dígito do radix sort (2048 baldes por passada, 6 passadas para 64 bits).
+RADIX_BITS = 11
+
+# O counting sort é usado quando a faixa de valores é no máximo
+# ``COUNTING_SORT_FACTOR * n + COUNTING_SORT_SLACK``, ou seja, O(n).
+COUNTING_SORT_FACTOR = 2
+COUNTING_SORT_SLACK = 256
+
+_SIGN_BIT = 1 << 63
+_ALL_BITS = (1 << 64) - 1
+
+
+def _counting_sort(data, low, span):
+    """Ordena inteiros entre ``low`` e ``low + span`` contando as ocorrências de cada valor."""
+    counts = array("Q", bytes(8 * (span + 1)))
+    for value in data:
+        counts[value - low] += 1
+    result = array("q")
+    for offset, count in enumerate(counts):
+        if count:
+            result.extend(array("q", [low + offset]) * count)
+    return result
+
+
+def _radix_sort_keys(keys, key_bits):
+    """
+    Ordena um ``array("Q")`` de chaves sem sinal com LSD radix sort.
+
+    Cada passada distribui as chaves em baldes pelo dígito atual, de forma estável, e
+    junta os baldes de volta em um ``array``. Só são feitas as passadas necessárias
+    para cobrir ``key_bits`` bits.
+    """
+    mask = (1 << RADIX_BITS) - 1
+    for shift in range(0, key_bits, RADIX_BITS):
+        buckets = [[] for _ in range(mask + 1)]
+        appends = [bucket.append for bucket in buckets]
+        for key in keys:
+            appends[(key >> shift) & mask](key)
+        keys = array("Q", chain.from_iterable(buckets))
+    return keys
+
+
+def _float_keys(values):
+    """
+    Converte ``float``s em chaves inteiras sem sinal com a mesma ordem.
+
+    Pelo formato IEEE 754, os bits de um ``float`` positivo já crescem com o valor:
+    basta ligar o bit de sinal. Nos negativos todos os bits são invertidos.
+    """
+    raw = array("Q")
+    raw.frombytes(array("d", values).tobytes())
+    return array(
+        "Q",
+        [bits ^ _ALL_BITS if bits & _SIGN_BIT else bits | _SIGN_BIT for bits in raw],
+    )
+
+
+def _float_values(keys):
+    """Desfaz ``_float_keys``."""
+    raw = array(
+        "Q", [key ^ _SIGN_BIT if key & _SIGN_BIT else key ^ _ALL_BITS for key in keys]
+    )
+    values = array("d")
+    values.frombytes(raw.tobytes())
+    return values
+
+
+def numeric_sort(data):
+    """
+    Ordena uma lista homogênea de ``int`` ou de ``float`` em tempo linear.
+    Retorna uma nova lista ordenada.
+
+    Inteiros com faixa de valores pequena (até cerca de 2n) usam counting sort. Os
+    demais inteiros de 64 bits são deslocados pelo menor valor (o que elimina os
+    negativos) e ordenados com LSD radix sort sobre um ``array("Q")``. ``float``s viram
+    chaves inteiras pelo truque de bits do IEEE 754 e passam pelo mesmo radix sort.
+    Qualquer outra entrada (tipos misturados, inteiros maiores que 64 bits) cai no
+    ``merge_sort``.
+
+    Complexidade de Tempo: O(n + k) no counting sort (k = faixa de valores) e
+    O(n · w / 11) no radix sort (w = bits das chaves, até 64).
+    Complexidade de Espaço: O(n + k) e O(n), respectivamente.
+    """
+    if len(data) < 2:
+        return data[:]
+
+    if all(type(value) is int for value in data):
+        low, high = min(data), max(data)
+        if low.bit_length() > 63 or high.bit_length() > 63:
+            return merge_sort(data)
+        span = high - low
+        if span <= COUNTING_SORT_FACTOR * len(data) + COUNTING_SORT_SLACK:
+            return _counting_sort(data, low, span).tolist()
+        keys = array("Q", [value - low for value in data])
+        return [key + low for key in _radix_sort_keys(keys, span.bit_length())]
+
+    if all(type(value) is float for value in data):
+        return _float_values(_radix_sort_keys(_float_keys(data), 64)).tolist()
+
+    return merge_sort(data)
+
+
+class _Reversed:
+    """Inverte a comparação de um valor, para usar o ``heapq`` (heap mínimo) como heap máximo."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+def top_k(data, k, key=None, largest=True):
+    """
+    Retorna os ``k`` maiores (ou menores, com ``largest=False``) elementos, em ordem.
+    Empates mantêm a ordem original, como em ``sorted``.
+
+    Mantém só um heap de ``k`` elementos, cuja raiz é o pior dos ``k`` melhores vistos
+    até agora; cada novo elemento é comparado apenas com ela.
+
+    Complexidade de Tempo: O(n log k)
+    Complexidade de Espaço: O(k)
+    """
+    if k <= 0:
+        return []
+
+    heap = []
+    for index, item in enumerate(data):
+        value = item if key is None else key(item)
+        # A raiz do heap é a entrada "menor": o pior valor e, no empate, o mais recente.
+        entry = (value, -index) if largest else (_Reversed(value), _Reversed(index))
+        if len(heap) < k:
+            heapq.heappush(heap, (entry, item))
+        elif heap[0][0] < entry:
+            heapq.heapreplace(heap, (entry, item))
+
+    return [item for _, item in sorted(heap, key=lambda pair: pair[0], reverse=True)]
+
+
+# Abaixo deste tamanho, a seleção ordena o trecho restante com insertion sort binário.
+SELECT_CUTOFF = 16
+
+
+def _three_way_partition(a, lo, hi, pivot):
+    """
+    Reorganiza ``a[lo:hi]`` em ``< pivot``, ``== pivot`` e ``> pivot``.
+
+    Retorna ``(lt, gt)``: ``a[lo:lt] < pivot``, ``a[lt:gt] == pivot`` e ``a[gt:hi] > pivot``.
+    """
+    lt, i, gt = lo, lo, hi
+    while i < gt:
+        value = a[i]
+        if value < pivot:
+            a[lt], a[i] = value, a[lt]
+            lt += 1
+            i += 1
+        elif pivot < value:
+            gt -= 1
+            a[gt], a[i] = value, a[gt]
+        else:
+            i += 1
+    return lt, gt
+
+
+def _median_of_medians(a, lo, hi):
+    """Pivô garantido pela mediana das medianas de grupos de 5 elementos de ``a[lo:hi]``."""
+    medians = []
+    for start in range(lo, hi, 5):
+        group = sorted(a[start : min(start + 5, hi)])
+        medians.append(group[(len(group) - 1) // 2])
+    return _select(medians, (len(medians) - 1) // 2, 0, len(medians), 0)
+
+
+def _select(a, k, lo, hi, depth_limit):
+    """
+    Coloca em ``a[k]`` o valor que estaria nessa posição se ``a[lo:hi]`` fosse ordenado.
+
+    Usa a mediana de três como pivô enquanto ``depth_limit`` permite; depois disso (ou
+    com ``depth_limit=0``), passa para a mediana das medianas, que garante tempo linear.
+    """
+    while hi - lo > SELECT_CUTOFF:
+        if depth_limit > 0:
+            depth_limit -= 1
+            x, y, z = a[lo], a[(lo + hi) // 2], a[hi - 1]
+            pivot = max(min(x, y), min(max(x, y), z))
+        else:
+            pivot = _median_of_medians(a, lo, hi)
+
+        lt, gt = _three_way_partition(a, lo, hi, pivot)
+        if k < lt:
+            hi = lt
+        elif k >= gt:
+            lo = gt
+        else:
+            return a[k]
+
+    _binary_insertion_sort(a, lo, hi, lo)
+    return a[k]
+
+
+def nth_element(data, k):
+    """
+    Retorna o ``k``-ésimo menor elemento (``k`` começando em 0) sem ordenar a lista inteira.
+
+    Introselect: quickselect com pivô pela mediana de três e, se a recursão passar de
+    2·log₂(n) partições (entrada adversária), mediana das medianas.
+
+    Complexidade de Tempo: O(n) no caso médio e no pior caso
+    Complexidade de Espaço: O(n), pois trabalha em uma cópia
+    """
+    n = len(data)
+    if not 0 <= k < n:
+        raise IndexError("k fora do intervalo da lista")
+    return _select(list(data), k, 0, n, 2 * n.bit_length())
+
+
+def median(data):
+    """
+    Retorna a mediana (média dos dois valores centrais quando ``n`` é par), como
+    ``statistics.median``, em tempo linear com ``nth_element``.
+
+    Complexidade de Tempo: O(n)
+    Complexidade de Espaço: O(n)
+    """
+    a = list(data)
+    n = len(a)
+    if n == 0:
+        raise ValueError("median() precisa de pelo menos um valor")
+
+    upper = _select(a, n // 2, 0, n, 2 * n.bit_length())
+    if n % 2:
+        return upper
+    # Depois da seleção, todos os elementos antes de ``n // 2`` são <= ``upper``.
+    return (max(a[: n // 2]) + upper) / 2
+
+
+class P2Quantile:
+    """
+    Estima o quantil ``p`` de uma sequência de valores em memória constante (algoritmo P²).
+
+    Guarda só cinco marcadores (mínimo, p/2, p, (1+p)/2 e máximo), cujas alturas são
+    ajustadas por interpolação parabólica a cada valor novo. Com até 5 valores o
+    resultado é exato.
+
+    Complexidade de Tempo: O(1) por valor
+    Complexidade de Espaço: O(1)
+    """
+
+    def __init__(self, p=0.5):
+        if not 0 <= p <= 1:
+            raise ValueError("p deve estar entre 0 e 1")
+        self.p = p
+        self.count = 0
+        self._heights = []
+        self._positions = [0, 1, 2, 3, 4]
+        self._desired = [0, 2 * p, 4 * p, 2 + 2 * p, 4]
+        self._increments = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def add(self, value):
+        """Adiciona um valor à estimativa."""
+        self.count += 1
+        heights = self._heights
+        if self.count <= 5:
+            insort(heights, value)
+            return
+
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = bisect_right(heights, value, 1, 4) - 1
+
+        positions, desired = self._positions, self._desired
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            desired[i] += self._increments[i]
+
+        for i in (1, 2, 3):
+            delta = desired[i] - positions[i]
+            if (delta >= 1 and positions[i + 1] - positions[i] > 1) or (
+                delta <= -1 and positions[i - 1] - positions[i] < -1
+            ):
+                step = 1 if delta > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = heights[i] + step * (heights[i + step] - heights[i]) / (
+                        positions[i + step] - positions[i]
+                    )
+                heights[i] = height
+                positions[i] += step
+
+    def _parabolic(self, i, step):
+        """Nova altura do marcador ``i`` pela fórmula parabólica (P²) ao movê-lo ``step`` posições."""
+        q, n = self._heights, self._positions
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    @property
+    def value(self):
+        """Quantil estimado (exato, com interpolação linear, enquanto houver até 5 valores)."""
+        if self.count == 0:
+            raise ValueError("P2Quantile ainda não recebeu nenhum valor")
+        if self.count <= 5:
+            position = self.p * (self.count - 1)
+            below = int(position)
+            above = min(below + 1, self.count - 1)
+            fraction = position - below
+            return (
+                self._heights[below]
+                + (self._heights[above] - self._heights[below]) * fraction
+            )
+        return self._heights[2]
+
+
 def big_o_analysis():
-    """Função para analisar e comparar a complexidade de Insertion Sort e Merge Sort."""
+    """Função para analisar e comparar a complexidade de Insertion Sort, Merge Sort e Numeric Sort."""
     # import random
     import math
     from rich.console import Console
     from rich.panel import Panel
     from rich.table import Table
 
-    from utils.measure_time import medir_tempo
+    from utils.benchmark import benchmark
+    from utils.measure_time import formatar_kib, formatar_ms
 
     # ------------------------------- Configuração ------------------------------- #
     N_ITEMS = 1000
+    REPETICOES = 5
     console = Console()
 
     console.print(
@@ -73,12 +669,23 @@ def big_o_analysis():
     # data_to_sort = [random.randint(0, 5000) for _ in range(N_ITEMS)] # Caso médio
 
     console.print("\nExecutando [bold red]Insertion Sort...[/]")
-    _, time_insert = medir_tempo(insertion_sort, data_to_sort)
-    console.print(f"Tempo de execução: [bold red]{time_insert} ms[/]")
+    bench_insert = benchmark(
+        insertion_sort, (data_to_sort,), repeat=REPETICOES, memory=True
+    )
+    time_insert = formatar_ms(bench_insert.median_ms)
+    console.print(f"Tempo de execução (mediana): [bold red]{time_insert} ms[/]")
 
     console.print("\nExecutando [bold green]Merge Sort...[/]")
-    _, time_merge = medir_tempo(merge_sort, data_to_sort)
-    console.print(f"Tempo de execução: [bold green]{time_merge} ms[/]")
+    bench_merge = benchmark(merge_sort, (data_to_sort,), repeat=REPETICOES, memory=True)
+    time_merge = formatar_ms(bench_merge.median_ms)
+    console.print(f"Tempo de execução (mediana): [bold green]{time_merge} ms[/]")
+
+    console.print("\nExecutando [bold blue]Numeric Sort (Counting/Radix)...[/]")
+    bench_numeric = benchmark(
+        numeric_sort, (data_to_sort,), repeat=REPETICOES, memory=True
+    )
+    time_numeric = formatar_ms(bench_numeric.median_ms)
+    console.print(f"Tempo de execução (mediana): [bold blue]{time_numeric} ms[/]")
 
     table = Table(title="\n\nAnálise de Complexidade (Big O)", show_lines=True)
     table.add_column(
@@ -86,19 +693,32 @@ def big_o_analysis():
         style="cyan",
     )
     table.add_column("Complexidade (Pior Caso)", style="magenta")
-    table.add_row("Insertion Sort", "O(n²)")
-    table.add_row("Merge Sort", "O(n log n)")
+    for coluna in ("Mín (ms)", "Mediana (ms)", "p95 (ms)", "Desvio (ms)"):
+        table.add_column(coluna, justify="right", style="green")
+    table.add_column("Pico de Memória (KiB)", justify="right", style="yellow")
+    for nome, complexidade, resultado in (
+        ("Insertion Sort", "O(n²)", bench_insert),
+        ("Merge Sort", "O(n log n)", bench_merge),
+        ("Numeric Sort (Counting/Radix)", "O(n + k)", bench_numeric),
+    ):
+        table.add_row(
+            nome,
+            complexidade,
+            formatar_ms(resultado.min_ms),
+            formatar_ms(resultado.median_ms),
+            formatar_ms(resultado.p95_ms),
+            formatar_ms(resultado.stddev_ms),
+            formatar_kib(resultado.peak_bytes),
+        )
     console.print(table)
 
     n = N_ITEMS
     log_n = math.log2(n)
     proporcao_teorica = n / log_n
 
-    tempo_insert_float = float(time_insert.replace(",", "."))
-    tempo_merge_float = float(time_merge.replace(",", "."))
     proporcao_pratica = (
-        tempo_insert_float / tempo_merge_float
-        if tempo_merge_float > 0
+        bench_insert.median_ms / bench_merge.median_ms
+        if bench_merge.median_ms > 0
         else float("inf")
     )
 
@@ -113,8 +733,12 @@ def big_o_analysis():
     Com n={N_ITEMS} e log₂({N_ITEMS})≈{log_n:.2f}, a proporção teórica é:
     [yellow]{N_ITEMS} / {log_n:.2f} ≈ {proporcao_teorica:.2f} vezes[/yellow]
 
-    A proporção PRÁTICA (medida pelo tempo) foi:
+    A proporção PRÁTICA (medida pela mediana de {REPETICOES} execuções) foi:
     [yellow]{time_insert} ms / {time_merge} ms ≈ {proporcao_pratica:.2f} vezes[/yellow]
+
+    [bold]E sem comparações?[/]
+    A lista é de inteiros em uma faixa pequena, então o [bold blue]Numeric Sort[/] usa counting sort.
+    Em tempo linear, O(n + k), ele levou [bold]{time_numeric} ms[/].
     """
 
     print("\n")
@@ -0,0 +1,148 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import heapq
+import os
+
+from core.o_notation import merge_sort
+
+
+def _numeric_typecode(data):
+    """
+    Retorna ``"q"`` para listas só de ``int``, ``"d"`` para listas só de ``float`` e
+    ``None`` caso contrário (misturar os dois converteria os ``int`` para ``float``).
+    """
+    if all(type(x) is int for x in data):
+        return "q"
+    if all(type(x) is float for x in data):
+        return "d"
+    return None
+
+
+def _partitions(n, parts):
+    """Divide ``range(n)`` em até ``parts`` intervalos ``(início, fim)`` de tamanhos parecidos."""
+    parts = max(1, min(parts, n))
+    bounds = [n * i // parts for i in range(parts + 1)]
+    return list(zip(bounds, bounds[1:]))
+
+
+def _sort_partition(name, typecode, lo, hi, algorithm):
+    """Ordena ``[lo, hi)`` do bloco de memória compartilhada ``name`` no lugar. Roda no processo filho."""
+    shm = shared_memory.SharedMemory(name=name)
+    view = shm.buf.cast("B").cast(typecode)
+    try:
+        view[lo:hi] = array(typecode, algorithm(view[lo:hi].tolist()))
+    finally:
+        view.release()
+        shm.close()
+
+
+def _merge_partitions(src_name, dst_name, typecode, lo, mid, hi):
+    """Intercala ``[lo, mid)`` e ``[mid, hi)`` de ``src_name`` em ``[lo, hi)`` de ``dst_name``. Roda no processo filho."""
+    src = shared_memory.SharedMemory(name=src_name)
+    dst = shared_memory.SharedMemory(name=dst_name)
+    src_view = src.buf.cast("B").cast(typecode)
+    dst_view = dst.buf.cast("B").cast(typecode)
+    try:
+        dst_view[lo:hi] = array(
+            typecode, heapq.merge(src_view[lo:mid].tolist(), src_view[mid:hi].tolist())
+        )
+    finally:
+        src_view.release()
+        dst_view.release()
+        src.close()
+        dst.close()
+
+
+def parallel_sort(data, workers=None, algorithm=merge_sort, executor=None):
+    """
+    Ordena uma lista de números em paralelo usando um pool de processos.
+    Retorna uma nova lista ordenada.
+
+    Os dados são copiados uma única vez para um bloco de ``shared_memory`` tipado
+    (``int`` 64 bits ou ``float``), dividido em ``workers`` partições. Cada processo
+    ordena a sua partição com ``algorithm`` (um dos algoritmos de ``core/o_notation.py``)
+    e as partições são intercaladas duas a duas, também em paralelo, alternando entre
+    dois blocos compartilhados, até sobrar uma só. Só nomes e índices passam pelo
+    ``pickle``. Listas que não são só de ``int`` ou só de ``float`` (ou com inteiros
+    maiores que 64 bits) são ordenadas com ``algorithm`` no próprio processo.
+
+    ``executor`` permite reaproveitar um ``ProcessPoolExecutor`` já criado (o custo de
+    criar os processos não entra na ordenação).
+
+    Complexidade de Tempo: O((n / p) log(n / p) + n log p) com p processos (O(n log n) de trabalho).
+    Complexidade de Espaço: O(n), dois blocos compartilhados de n posições.
+    """
+    workers = workers or os.cpu_count() or 1
+    typecode = _numeric_typecode(data)
+    n = len(data)
+    if typecode is None or n < 2:
+        return algorithm(data)
+
+    try:
+        values = array(typecode, data)
+    except OverflowError:
+        # Inteiros fora da faixa de 64 bits não cabem no bloco tipado.
+        return algorithm(data)
+    itemsize = values.itemsize
+    size = n * itemsize
+    blocks = [shared_memory.SharedMemory(create=True, size=size) for _ in range(2)]
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        blocks[0].buf[:size] = values.tobytes()
+        del values
+
+        partitions = _partitions(n, workers)
+        futures = [
+            executor.submit(
+                _sort_partition, blocks[0].name, typecode, lo, hi, algorithm
+            )
+            for lo, hi in partitions
+        ]
+        for future in futures:
+            future.result()
+
+        src, dst = 0, 1
+        while len(partitions) > 1:
+            merges = [
+                (partitions[i][0], partitions[i][1], partitions[i + 1][1])
+                for i in range(0, len(partitions) - 1, 2)
+            ]
+            futures = [
+                executor.submit(
+                    _merge_partitions,
+                    blocks[src].name,
+                    blocks[dst].name,
+                    typecode,
+                    lo,
+                    mid,
+                    hi,
+                )
+                for lo, mid, hi in merges
+            ]
+            merged = [(lo, hi) for lo, _, hi in merges]
+            if len(partitions) % 2:
+                # A última partição não tem par nesta rodada e é só copiada.
+                lo, hi = partitions[-1]
+                blocks[dst].buf[lo * itemsize : hi * itemsize] = blocks[src].buf[
+                    lo * itemsize : hi * itemsize
+                ]
+                merged.append((lo, hi))
+            for future in futures:
+                future.result()
+            partitions = merged
+            src, dst = dst, src
+
+        view = blocks[src].buf.cast("B").cast(typecode)
+        try:
+            return view[:n].tolist()
+        finally:
+            view.release()
+    finally:
+        if own_executor:
+            executor.shutdown()
+        for block in blocks:
+            block.close()
+            block.unlink()
@@ -0,0 +1,270 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import csv
+import itertools
+import json
+
+from core.batch import PreparedText, score_pairs
+from core.dp import ALGORITHM_VERSION
+from utils.cache.distance_cache import DistanceCache
+
+
+@dataclass
+class PromptJob:
+    """Respostas de um prompt (na ordem das LLMs) e o que falta calcular para elas."""
+
+    prompt: int
+    texts: list | None
+    hashes: list = field(default_factory=list)
+    cached: dict = field(default_factory=dict)
+    missing: list = field(default_factory=list)
+
+
+def discover(corpus, num_prompts=None):
+    """
+    Etapa 1: gera, em ordem crescente, os números dos prompts presentes no ``Corpus``.
+
+    Os prompts vêm dos arquivos encontrados por ``discover_corpus``, então lacunas na
+    numeração são puladas. Com ``num_prompts``, só os prompts até esse número entram.
+    """
+    for prompt in corpus.prompts:
+        if num_prompts is not None and prompt > num_prompts:
+            break
+        yield prompt
+
+
+def load(prompts, corpus, llms):
+    """
+    Etapa 2: monta um ``PromptJob`` por prompt com as respostas das ``llms``, na ordem dada.
+
+    Se alguma resposta faltar no corpus, o job sai com ``texts=None``.
+    """
+    for prompt in prompts:
+        texts = [corpus.get(llm, prompt) for llm in llms]
+        yield PromptJob(prompt, None if any(text is None for text in texts) else texts)
+
+
+def filter_cached(jobs, index_pairs, algorithm_name, cache=None):
+    """
+    Etapa 3: separa, em cada job, os pares que já estão no cache dos que faltam calcular.
+
+    Sem cache, todos os pares ficam em ``missing``.
+    """
+    for job in jobs:
+        if job.texts is not None:
+            if cache is not None:
+                job.hashes = [DistanceCache.text_hash(text) for text in job.texts]
+                for a, b in index_pairs:
+                    value = cache.get(
+                        algorithm_name, ALGORITHM_VERSION, job.hashes[a], job.hashes[b]
+                    )
+                    if value is not None:
+                        job.cached[(a, b)] = value
+            job.missing = [pair for pair in index_pairs if pair not in job.cached]
+        yield job
+
+
+# Prompts enviados juntos em cada tarefa do pool de processos.
+DEFAULT_CHUNKSIZE = 4
+
+
+def _compare_texts(texts, index_pairs, algorithm):
+    """Compara os pares de um prompt."""
+    prepared = [PreparedText(text) for text in texts]
+    return list(score_pairs(prepared, index_pairs, algorithm))
+
+
+def _compare_batch(batch, algorithm):
+    """Compara um lote de ``(textos, pares)``. Fica no nível do módulo para poder ser enviada a outros processos."""
+    return [
+        _compare_texts(texts, index_pairs, algorithm) for texts, index_pairs in batch
+    ]
+
+
+def _needs_compare(job):
+    return job.texts is not None and bool(job.missing)
+
+
+def _batch_results(jobs, future):
+    """Gera ``(job, valores_calculados)`` para um lote já enviado ao pool."""
+    computed = iter(future.result() if future is not None else ())
+    for job in jobs:
+        yield job, next(computed) if _needs_compare(job) else []
+
+
+def compare(jobs, algorithm, workers=None, max_in_flight=None, chunksize=None):
+    """
+    Etapa 4: calcula os pares que faltam e gera ``(job, valores_calculados)`` na ordem dos jobs.
+
+    Com ``workers`` maior que 1, os prompts vão para um ``ProcessPoolExecutor`` em lotes
+    de ``chunksize`` (menos serialização por tarefa), com no máximo ``max_in_flight``
+    lotes (padrão: 2 por processo) em andamento. Só quando o mais antigo termina é que
+    novos jobs são pedidos à etapa anterior, então a leitura nunca se adianta muito ao
+    cálculo (backpressure).
+    """
+    if not workers or workers <= 1:
+        for job in jobs:
+            if _needs_compare(job):
+                yield job, _compare_texts(job.texts, job.missing, algorithm)
+            else:
+                yield job, []
+        return
+
+    max_in_flight = max_in_flight or 2 * workers
+    chunksize = chunksize or DEFAULT_CHUNKSIZE
+    jobs = iter(jobs)
+    in_flight = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while batch := list(itertools.islice(jobs, chunksize)):
+            work = [(job.texts, job.missing) for job in batch if _needs_compare(job)]
+            future = executor.submit(_compare_batch, work, algorithm) if work else None
+            in_flight.append((batch, future))
+            while len(in_flight) >= max_in_flight:
+                yield from _batch_results(*in_flight.popleft())
+        while in_flight:
+            yield from _batch_results(*in_flight.popleft())
+
+
+def aggregate(results, pairs, index_pairs, aggregates, algorithm_name, cache=None):
+    """
+    Etapa 5: junta valores do cache e calculados, grava os novos no cache e alimenta
+    os agregadores (``{"llm1-llm2": RunningStats}``).
+
+    Gera ``(prompt, distancias)``, com ``distancias=None`` quando faltou algum arquivo.
+    """
+    keys = [f"{l1}-{l2}" for l1, l2 in pairs]
+    for job, computed in results:
+        if job.texts is None:
+            yield job.prompt, None
+            continue
+
+        values = dict(job.cached)
+        values.update(zip(job.missing, computed))
+        if cache is not None and job.missing:
+            cache.set_many(
+                (algorithm_name, ALGORITHM_VERSION, job.hashes[a], job.hashes[b], value)
+                for (a, b), value in zip(job.missing, computed)
+            )
+
+        distances = {}
+        for key, pair in zip(keys, index_pairs):
+            aggregates[key].add(values[pair])
+            distances[key] = values[pair]
+        yield job.prompt, distances
+
+
+def distance_pipeline(
+    corpus,
+    llms,
+    algorithm,
+    aggregates,
+    workers=None,
+    cache=None,
+    num_prompts=None,
+    max_in_flight=None,
+    chunksize=None,
+):
+    """
+    Monta o pipeline discover → load → filter → compare → aggregate sobre um ``Corpus``
+    e gera ``(prompt, distancias)`` um prompt por vez.
+
+    Nada é calculado até o gerador ser consumido, e cada etapa só pede o próximo item
+    à anterior quando precisa dele.
+    """
+    pairs = list(itertools.combinations(llms, 2))
+    index_pairs = list(itertools.combinations(range(len(llms)), 2))
+    algorithm_name = getattr(algorithm, "__name__", repr(algorithm))
+
+    jobs = load(discover(corpus, num_prompts), corpus, llms)
+    jobs = filter_cached(jobs, index_pairs, algorithm_name, cache)
+    results = compare(jobs, algorithm, workers, max_in_flight, chunksize)
+    return aggregate(results, pairs, index_pairs, aggregates, algorithm_name, cache)
+
+
+def drain(stream, *sinks):
+    """Etapa 6: consome o pipeline, enviando cada ``(prompt, distancias)`` a todos os sinks."""
+    count = 0
+    for prompt, distances in stream:
+        for sink in sinks:
+            sink.write(prompt, distances)
+        count += 1
+    return count
+
+
+class JsonlSink:
+    """Grava cada prompt como uma linha JSON: ``{"prompt": N, "distances": {...}}``."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write(self, prompt, distances):
+        record = {"prompt": prompt, "distances": distances}
+        if distances is None:
+            record["error"] = "arquivo ausente"
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class CsvSink:
+    """Grava um CSV com uma coluna por par de LLMs; prompts com erro ficam com as colunas vazias."""
+
+    def __init__(self, path, pairs):
+        self.path = path
+        self._keys = [f"{l1}-{l2}" for l1, l2 in pairs]
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(["prompt", *self._keys])
+
+    def write(self, prompt, distances):
+        distances = distances or {}
+        self._writer.writerow([prompt, *(distances.get(key, "") for key in self._keys)])
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class RichTableSink:
+    """
+    Adiciona uma linha a uma tabela Rich a cada prompt, redesenhando-a ao vivo.
+
+    ``make_row(prompt, distancias)`` retorna as células da linha.
+    """
+
+    def __init__(self, table, make_row, console=None):
+        from rich.live import Live
+
+        self.table = table
+        self._make_row = make_row
+        self._live = Live(table, console=console, auto_refresh=False)
+
+    def write(self, prompt, distances):
+        self.table.add_row(*self._make_row(prompt, distances))
+        self._live.refresh()
+
+    def close(self):
+        self._live.stop()
+
+    def __enter__(self):
+        self._live.start(refresh=True)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,122 @@
+import math
+
+from core.o_notation import P2Quantile, median, nth_element
+
+
+class RunningStats:
+    """
+    Estatísticas de uma sequência de valores calculadas à medida que eles chegam.
+
+    Média e variância pelo algoritmo de Welford (numericamente estável), mínimo,
+    máximo, histograma com baldes de largura ``bucket_width`` e quantis. Enquanto
+    houver até ``exact_limit`` valores, eles são guardados e os quantis são exatos;
+    depois disso, os valores são descartados e os quantis vêm dos estimadores P²
+    (``quantiles``), então a memória por agregador fica limitada.
+
+    Complexidade de Tempo: O(1) por valor (amortizado)
+    Complexidade de Espaço: O(exact_limit + baldes)
+    """
+
+    def __init__(self, quantiles=(0.5,), bucket_width=10, exact_limit=1000):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = None
+        self.max = None
+        self.bucket_width = bucket_width
+        self._buckets = {}
+        self.exact_limit = exact_limit
+        self._values = []
+        self._quantiles = {p: P2Quantile(p) for p in quantiles}
+
+    def __len__(self):
+        return self.count
+
+    def add(self, value):
+        """Adiciona um valor a todas as estatísticas."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+        bucket = math.floor(value / self.bucket_width) * self.bucket_width
+        self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+
+        for estimator in self._quantiles.values():
+            estimator.add(value)
+        if self._values is not None:
+            if self.count <= self.exact_limit:
+                self._values.append(value)
+            else:
+                self._values = None
+
+    def update(self, values):
+        """Adiciona todos os valores de um iterável."""
+        for value in values:
+            self.add(value)
+
+    @property
+    def exact(self):
+        """Indica se os quantis ainda são exatos (todos os valores estão guardados)."""
+        return self._values is not None
+
+    @property
+    def variance(self):
+        """Variância amostral (``n - 1``), como ``statistics.variance``; 0.0 com menos de 2 valores."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stddev(self):
+        """Desvio padrão amostral."""
+        return math.sqrt(self.variance)
+
+    def quantile(self, p):
+        """
+        Retorna o quantil ``p`` (entre 0 e 1), com interpolação linear entre os vizinhos.
+
+        Exato enquanto os valores estão guardados; depois, só os quantis informados em
+        ``quantiles`` estão disponíveis, estimados pelo P².
+        """
+        if self.count == 0:
+            raise ValueError("RunningStats ainda não recebeu nenhum valor")
+        if self._values is not None:
+            if p == 0.5:
+                return median(self._values)
+            position = p * (self.count - 1)
+            below = int(position)
+            low = nth_element(self._values, below)
+            if position == below:
+                return low
+            return low + (nth_element(self._values, below + 1) - low) * (
+                position - below
+            )
+        if p not in self._quantiles:
+            raise KeyError(f"quantil {p} não está sendo estimado")
+        return self._quantiles[p].value
+
+    @property
+    def median(self):
+        """Mediana (quantil 0.5)."""
+        return self.quantile(0.5)
+
+    @property
+    def histogram(self):
+        """Lista ``(início_do_balde, contagem)`` em ordem crescente."""
+        return sorted(self._buckets.items())
+
+    def as_dict(self):
+        """Retorna as estatísticas atuais como dicionário."""
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "stddev": self.stddev,
+            "min": self.min,
+            "max": self.max,
+            "median": self.median if self.count else None,
+            "histogram": self.histogram,
+        }
@@ -0,0 +1,117 @@
+from core.dp import _lower_chars
+
+
+class SuffixAutomaton:
+    """
+    Autômato de sufixos construído uma única vez sobre um texto de referência.
+
+    Permite encontrar a maior substring comum entre a referência e várias consultas
+    sem reconstruir o índice, o que é o caso de comparar uma resposta de referência
+    com muitas respostas candidatas.
+
+    Complexidade de construção: O(m)
+    Complexidade de cada consulta: O(n)
+    Complexidade de espaço: O(m)
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self._next = [{}]
+        self._link = [-1]
+        self._length = [0]
+        self._first_pos = [-1]
+        self._last = 0
+
+        for c in _lower_chars(text):
+            self._extend(c)
+
+    def _new_state(self, length, first_pos, transitions=None, link=-1):
+        self._next.append(dict(transitions) if transitions else {})
+        self._link.append(link)
+        self._length.append(length)
+        self._first_pos.append(first_pos)
+        return len(self._length) - 1
+
+    def _extend(self, c):
+        """Adiciona o caractere ``c`` ao final do texto indexado."""
+        nxt, link, length = self._next, self._link, self._length
+
+        cur = self._new_state(length[self._last] + 1, length[self._last])
+        p = self._last
+        while p != -1 and c not in nxt[p]:
+            nxt[p][c] = cur
+            p = link[p]
+
+        if p == -1:
+            link[cur] = 0
+        else:
+            q = nxt[p][c]
+            if length[p] + 1 == length[q]:
+                link[cur] = q
+            else:
+                clone = self._new_state(
+                    length[p] + 1, self._first_pos[q], nxt[q], link[q]
+                )
+                while p != -1 and nxt[p].get(c) == q:
+                    nxt[p][c] = clone
+                    p = link[p]
+                link[q] = clone
+                link[cur] = clone
+
+        self._last = cur
+
+    def longest_common_substring(self, query, with_offsets=False):
+        """
+        Calcula o comprimento da maior substring comum entre a referência e ``query``.
+
+        Com ``with_offsets=True`` retorna a tupla ``(comprimento, inicio_referencia,
+        inicio_query)``; os índices são -1 quando não há caractere em comum.
+        """
+        return self.match_chars(_lower_chars(query), with_offsets)
+
+    def match_chars(self, chars, with_offsets=False):
+        """Igual a ``longest_common_substring``, mas recebe a consulta já convertida para minúsculo."""
+        nxt, link, length, first_pos = (
+            self._next,
+            self._link,
+            self._length,
+            self._first_pos,
+        )
+        state = 0
+        current = 0
+        best = 0
+        best_state = best_end = -1
+
+        for i, c in enumerate(chars):
+            while state and c not in nxt[state]:
+                state = link[state]
+                current = length[state]
+            if c in nxt[state]:
+                state = nxt[state][c]
+                current += 1
+            else:
+                state = 0
+                current = 0
+
+            if current > best:
+                best = current
+                best_state = state
+                best_end = i
+
+        if not with_offsets:
+            return best
+        if best == 0:
+            return 0, -1, -1
+        return best, first_pos[best_state] - best + 1, best_end - best + 1
+
+
+def longest_common_substring_sam(s1, s2, with_offsets=False):
+    """
+    Calcula o comprimento da maior substring comum usando um autômato de sufixos sobre ``s1``.
+
+    Com ``with_offsets=True`` retorna ``(comprimento, inicio_em_s1, inicio_em_s2)``.
+
+    Complexidade de tempo: O(m + n)
+    Complexidade de espaço: O(m)
+    """
+    return SuffixAutomaton(s1).longest_common_substring(s2, with_offsets)
@@ -107,9 +107,15 @@ class IntPromptPT(IntPrompt):
             )
 
 
-def ask_input_int(prompt_text="Escolha uma opção: ", default=None):
-    """Solicita um número inteiro do usuário."""
-    return IntPromptPT.ask(prompt_text, default=default)
+def ask_input_int(prompt_text="Escolha uma opção: ", default=None, min_value=None):
+    """Solicita um número inteiro do usuário, repetindo a pergunta se for menor que ``min_value``."""
+    while True:
+        value = IntPromptPT.ask(prompt_text, default=default)
+        if min_value is None or value >= min_value:
+            return value
+        console.print(
+            f"\n[bold red]❌ Por favor, digite um número maior ou igual a {min_value}.[/bold red]\n"
+        )
 
 
 def show_message(message, style="bold green", new_line_start=True):
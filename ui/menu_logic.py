@@ -2,6 +2,7 @@ from ui import config
 import core.dp as dp
 import core.llm_analysis as llm
 import core.o_notation as o_notation
+from utils.ingestion import TruncationPolicy
 
 from . import menu
 
@@ -47,8 +48,27 @@ def compare_llm_responses():
         chave_algoritmo,  # type: ignore
         (dp.levenshtein_distance_iter, "🔗 Levenshtein"),
     )
+
+    chave_trecho = menu.ask_input(
+        "Trecho comparado: [1] Primeiros N caracteres, [2] Texto completo, [3] Janela",
+        choices=["1", "2", "3"],
+        default="1",
+    )
+    policy = {
+        "1": TruncationPolicy.PREFIX,
+        "2": TruncationPolicy.FULL,
+        "3": TruncationPolicy.WINDOW,
+    }[chave_trecho]
+    limit, offset = 100, 0
+    if policy is TruncationPolicy.WINDOW:
+        offset = menu.ask_input_int(
+            "Caractere inicial da janela", default=0, min_value=0
+        )
+    if policy is not TruncationPolicy.FULL:
+        limit = menu.ask_input_int("Quantidade de caracteres", default=100, min_value=1)
+
     menu.clear_console()
-    llm.compare_llm_responses(algorithm)
+    llm.compare_llm_responses(algorithm, policy=policy, limit=limit, offset=offset)
 
 
 def big_o_analysis():
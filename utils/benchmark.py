@@ -0,0 +1,278 @@
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+import gc
+import json
+import math
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+
+
+@dataclass
+class BenchmarkResult:
+    """Estatísticas (em milissegundos) de várias execuções cronometradas de uma função."""
+
+    name: str
+    rounds: int
+    warmup: int
+    min_ms: float
+    median_ms: float
+    mean_ms: float
+    p95_ms: float
+    stddev_ms: float
+    params: dict = field(default_factory=dict)
+    peak_bytes: int | None = None
+    retained_blocks: int | None = None
+    result: object = field(default=None, repr=False)
+
+    def as_dict(self) -> dict:
+        """Retorna os campos numéricos (sem o valor retornado pela função) para exportação."""
+        data = asdict(self)
+        data.pop("result")
+        return data
+
+
+def percentile(values, pct):
+    """Percentil pelo método nearest-rank (``pct`` entre 0 e 100)."""
+    ordered = sorted(values)
+    if not ordered:
+        raise ValueError("percentile() precisa de pelo menos um valor")
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+@dataclass
+class MemoryUsage:
+    """Memória usada por uma execução, medida com ``tracemalloc``."""
+
+    peak_bytes: int
+    retained_bytes: int
+    retained_blocks: int
+
+
+def measure_memory(func, args=(), kwargs=None):
+    """
+    Executa ``func(*args, **kwargs)`` uma vez sob ``tracemalloc`` e retorna ``(resultado, MemoryUsage)``.
+
+    ``peak_bytes`` é o pico alocado durante a chamada, acima do que já estava em uso
+    antes dela. ``retained_bytes``/``retained_blocks`` contam o que continuou alocado ao
+    final (incluindo o valor retornado), o que revela caches e estruturas que vazam da
+    chamada. Não são o número total de alocações: blocos alocados e liberados durante
+    a chamada não aparecem na diferença entre os snapshots.
+    """
+    kwargs = kwargs or {}
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    ignore_tracemalloc = [tracemalloc.Filter(False, tracemalloc.__file__)]
+
+    try:
+        gc.collect()
+        before = tracemalloc.take_snapshot().filter_traces(ignore_tracemalloc)
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+
+        result = func(*args, **kwargs)
+
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot().filter_traces(ignore_tracemalloc)
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    diff = after.compare_to(before, "filename")
+    return result, MemoryUsage(
+        peak_bytes=max(peak - baseline, 0),
+        retained_bytes=sum(stat.size_diff for stat in diff),
+        retained_blocks=sum(stat.count_diff for stat in diff),
+    )
+
+
+def benchmark(
+    func,
+    args=(),
+    kwargs=None,
+    *,
+    name=None,
+    warmup=1,
+    repeat=7,
+    disable_gc=True,
+    params=None,
+    memory=False,
+):
+    """
+    Mede ``func(*args, **kwargs)`` com aquecimento, repetições e coleta de lixo controlada.
+
+    As ``warmup`` primeiras execuções não entram nas estatísticas. Com
+    ``disable_gc=True`` o coletor é executado antes das medições e desligado durante
+    elas, para que pausas de GC não apareçam como ruído. Com ``memory=True`` uma
+    execução extra, fora da cronometragem (o ``tracemalloc`` deixa o código mais
+    lento), registra o pico de memória e os blocos que continuam alocados depois da
+    chamada (``retained_blocks``).
+    """
+    if repeat < 1:
+        raise ValueError("repeat deve ser maior ou igual a 1")
+    kwargs = kwargs or {}
+
+    for _ in range(warmup):
+        func(*args, **kwargs)
+
+    gc_was_enabled = gc.isenabled()
+    if disable_gc:
+        gc.collect()
+        gc.disable()
+
+    times = []
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            times.append((time.perf_counter() - start) * 1000)
+    finally:
+        if disable_gc and gc_was_enabled:
+            gc.enable()
+
+    usage = measure_memory(func, args, kwargs)[1] if memory else None
+
+    return BenchmarkResult(
+        name=name or getattr(func, "__name__", repr(func)),
+        rounds=repeat,
+        warmup=warmup,
+        min_ms=min(times),
+        median_ms=statistics.median(times),
+        mean_ms=statistics.fmean(times),
+        p95_ms=percentile(times, 95),
+        stddev_ms=statistics.stdev(times) if len(times) > 1 else 0.0,
+        params=dict(params or {}),
+        peak_bytes=usage.peak_bytes if usage else None,
+        retained_blocks=usage.retained_blocks if usage else None,
+        result=result,
+    )
+
+
+def _git_commit():
+    """Retorna o hash do commit atual, ou ``None`` fora de um repositório git."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def export_json(results, path, metadata=None):
+    """
+    Salva os resultados em JSON, junto com data, versão do Python e commit atual,
+    para comparar execuções entre commits.
+    """
+    data = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "commit": _git_commit(),
+        **(metadata or {}),
+        "results": [result.as_dict() for result in results],
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=4, ensure_ascii=False)
+    return path
+
+
+# Curvas candidatas para o ajuste de complexidade, em função dos tamanhos (m, n).
+COMPLEXITY_MODELS = {
+    "O(n)": lambda m, n: n,
+    "O(n log n)": lambda m, n: n * math.log2(max(n, 2)),
+    "O(n²)": lambda m, n: n * n,
+    "O(m·n)": lambda m, n: m * n,
+}
+
+
+@dataclass
+class ComplexityFit:
+    """Resultado do ajuste de tempos medidos a curvas de complexidade."""
+
+    best_model: str
+    constant: float
+    exponent: float
+    coefficient: float
+    residuals: dict
+
+
+def fit_power_law(sizes, times):
+    """
+    Ajusta ``tempo ≈ coeficiente * n ** expoente`` por mínimos quadrados em escala log-log.
+
+    Retorna ``(expoente, coeficiente)``.
+    """
+    points = [
+        (math.log(n), math.log(t)) for n, t in zip(sizes, times) if n > 0 and t > 0
+    ]
+    if len(points) < 2:
+        raise ValueError("fit_power_law() precisa de pelo menos dois pontos positivos")
+    mean_x = statistics.fmean(x for x, _ in points)
+    mean_y = statistics.fmean(y for _, y in points)
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    if sxx == 0:
+        raise ValueError(
+            "fit_power_law() precisa de pelo menos dois tamanhos diferentes"
+        )
+    exponent = sum((x - mean_x) * (y - mean_y) for x, y in points) / sxx
+    return exponent, math.exp(mean_y - exponent * mean_x)
+
+
+def size_axis(pairs):
+    """
+    Tamanhos usados no ajuste de lei de potência: ``n`` ou, se ``n`` não varia
+    (varredura com ``n`` fixo), ``m``.
+    """
+    axis = [n for _, n in pairs]
+    if len(set(axis)) < 2:
+        axis = [m for m, _ in pairs]
+    return axis
+
+
+def fit_complexity(sizes, times, models=None):
+    """
+    Ajusta os tempos a cada curva candidata e escolhe a de menor erro.
+
+    ``sizes`` é uma lista de tamanhos ``n`` ou de pares ``(m, n)``. Para cada curva
+    ``f``, a constante ``c`` de ``tempo ≈ c * f(m, n)`` vem de mínimos quadrados
+    (``c = Σ t·f / Σ f²``) e o erro é a soma dos quadrados dos resíduos relativos,
+    para que os tamanhos pequenos pesem tanto quanto os grandes.
+
+    Com ``m == n`` em todos os pontos, O(n²) e O(m·n) são a mesma curva; só uma
+    varredura em que um dos tamanhos fica fixo consegue separar as duas.
+    """
+    models = models or COMPLEXITY_MODELS
+    pairs = [size if isinstance(size, tuple) else (size, size) for size in sizes]
+
+    residuals = {}
+    constants = {}
+    for name, model in models.items():
+        values = [model(m, n) for m, n in pairs]
+        denominator = sum(f * f for f in values)
+        if denominator == 0:
+            continue
+        constant = sum(t * f for t, f in zip(times, values)) / denominator
+        constants[name] = constant
+        residuals[name] = sum(
+            ((t - constant * f) / t) ** 2 for t, f in zip(times, values) if t > 0
+        )
+
+    best_model = min(residuals, key=residuals.get)
+    exponent, coefficient = fit_power_law(size_axis(pairs), times)
+    return ComplexityFit(
+        best_model=best_model,
+        constant=constants[best_model],
+        exponent=exponent,
+        coefficient=coefficient,
+        residuals=residuals,
+    )
@@ -0,0 +1,151 @@
+from pathlib import Path
+import hashlib
+import logging
+import sqlite3
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class DistanceCache:
+    """
+    Cache persistente (SQLite) de resultados de comparação entre pares de textos.
+
+    Cada entrada é identificada por (nome do algoritmo, versão do algoritmo, hash do
+    texto A, hash do texto B), então editar um arquivo só invalida os pares que usam
+    aquele texto. Ao passar de ``max_entries``, as entradas usadas há mais tempo são
+    removidas (LRU).
+
+    As leituras não gravam nada: os acessos (``last_access``) ficam pendentes e são
+    gravados em uma única transação junto com o próximo ``set_many``, a cada
+    ``touch_batch`` acessos ou ao fechar o cache.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "data/cache/distances.sqlite3",
+        max_entries: int = 100_000,
+        touch_batch: int = 1000,
+    ):
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self.touch_batch = touch_batch
+        self._touched = {}
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS distances (
+                algorithm TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                hash_a TEXT NOT NULL,
+                hash_b TEXT NOT NULL,
+                value NUMERIC NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (algorithm, version, hash_a, hash_b)
+            )
+            """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_distances_last_access ON distances (last_access)"
+        )
+        self._conn.commit()
+        # Limite superior do número de entradas; só é recontado quando passa de ``max_entries``.
+        self._count_bound = len(self)
+
+    @staticmethod
+    def text_hash(text: str) -> str:
+        """Retorna o hash SHA-256 (hexadecimal) do conteúdo do texto."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get(self, algorithm: str, version: int, hash_a: str, hash_b: str):
+        """Retorna o valor armazenado para o par ou ``None`` se não estiver no cache."""
+        try:
+            row = self._conn.execute(
+                "SELECT value FROM distances "
+                "WHERE algorithm = ? AND version = ? AND hash_a = ? AND hash_b = ?",
+                (algorithm, version, hash_a, hash_b),
+            ).fetchone()
+            if row is None:
+                return None
+        except sqlite3.Error as e:
+            logger.error(f"Error reading distance cache: {e}")
+            return None
+
+        self._touched[(algorithm, version, hash_a, hash_b)] = time.time()
+        if len(self._touched) >= self.touch_batch:
+            self.flush()
+        return row[0]
+
+    def _write_touches(self) -> None:
+        """Grava os acessos pendentes na transação atual (sem ``commit``)."""
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE distances SET last_access = ? "
+                "WHERE algorithm = ? AND version = ? AND hash_a = ? AND hash_b = ?",
+                [(when, *key) for key, when in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def flush(self) -> None:
+        """Grava os acessos pendentes em uma única transação."""
+        try:
+            self._write_touches()
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Error writing distance cache: {e}")
+
+    def set(self, algorithm: str, version: int, hash_a: str, hash_b: str, value):
+        """Armazena o valor de um par."""
+        self.set_many([(algorithm, version, hash_a, hash_b, value)])
+
+    def set_many(self, entries) -> None:
+        """Armazena várias tuplas ``(algoritmo, versão, hash_a, hash_b, valor)`` em uma única transação."""
+        now = time.time()
+        rows = [(*entry, now) for entry in entries]
+        try:
+            self._write_touches()
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO distances "
+                "(algorithm, version, hash_a, hash_b, value, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._count_bound += len(rows)
+            if self._count_bound > self.max_entries:
+                self._evict()
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Error writing distance cache: {e}")
+
+    def _evict(self) -> None:
+        """Remove as entradas usadas há mais tempo até respeitar ``max_entries``."""
+        count = len(self)
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM distances WHERE rowid IN "
+                "(SELECT rowid FROM distances ORDER BY last_access LIMIT ?)",
+                (excess,),
+            )
+            count = self.max_entries
+        self._count_bound = count
+
+    def clear(self) -> None:
+        """Remove todas as entradas do cache."""
+        self._touched.clear()
+        self._conn.execute("DELETE FROM distances")
+        self._conn.commit()
+        self._count_bound = 0
+
+    def close(self) -> None:
+        """Grava os acessos pendentes e fecha a conexão com o banco."""
+        self.flush()
+        self._conn.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM distances").fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
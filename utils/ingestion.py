@@ -0,0 +1,112 @@
+from enum import Enum
+import codecs
+import io
+import mmap
+import os
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class TruncationPolicy(Enum):
+    PREFIX = "prefix"
+    WINDOW = "window"
+    FULL = "full"
+
+
+def iter_text_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE, encoding="utf-8"):
+    """
+    Lê um arquivo em blocos de ``chunk_size`` bytes e devolve o texto decodificado aos poucos.
+
+    O arquivo é mapeado em memória (``mmap``) e decodificado por um decodificador
+    incremental, então um caractere multibyte dividido entre dois blocos é tratado
+    corretamente e o arquivo nunca precisa caber inteiro em uma ``str``. Quebras de
+    linha são normalizadas para ``\\n``, como no ``open`` em modo texto.
+    """
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder(encoding)(), translate=True
+    )
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for start in range(0, len(mm), chunk_size):
+                text = decoder.decode(mm[start : start + chunk_size])
+                if text:
+                    yield text
+
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def iter_text_windows(path, size, step=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Gera janelas deslizantes de ``size`` caracteres, avançando ``step`` caracteres por vez.
+
+    A última janela pode ser menor que ``size``. A memória usada é limitada a uma
+    janela mais um bloco de leitura.
+    """
+    step = step or size
+    if size <= 0 or step <= 0:
+        raise ValueError("size e step devem ser maiores que zero")
+
+    buffer = ""
+    covered = 0  # Caracteres do início do buffer que já saíram na última janela.
+    pending_skip = 0  # Caracteres ainda a pular quando ``step`` é maior que ``size``.
+    for chunk in iter_text_chunks(path, chunk_size):
+        if pending_skip:
+            skipped = min(pending_skip, len(chunk))
+            chunk = chunk[skipped:]
+            pending_skip -= skipped
+        buffer += chunk
+        while len(buffer) >= size:
+            yield buffer[:size]
+            if step <= len(buffer):
+                buffer = buffer[step:]
+                covered = max(size - step, 0)
+            else:
+                pending_skip = step - len(buffer)
+                buffer = ""
+                covered = 0
+
+    if len(buffer) > covered:
+        yield buffer
+
+
+def read_text(
+    path,
+    policy=TruncationPolicy.FULL,
+    limit=None,
+    offset=0,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+):
+    """
+    Lê o texto de um arquivo de acordo com a política de truncamento.
+
+    - ``FULL``: o arquivo inteiro.
+    - ``PREFIX``: os primeiros ``limit`` caracteres.
+    - ``WINDOW``: ``limit`` caracteres a partir do caractere ``offset``.
+
+    Nas políticas truncadas a leitura para assim que a janela é preenchida.
+    """
+    policy = TruncationPolicy(policy)
+    if policy is TruncationPolicy.FULL:
+        return "".join(iter_text_chunks(path, chunk_size))
+    if limit is None:
+        raise ValueError(f"A política {policy.value} exige um limite de caracteres")
+    if limit < 0 or offset < 0:
+        raise ValueError("limit e offset não podem ser negativos")
+
+    start = 0 if policy is TruncationPolicy.PREFIX else offset
+    end = start + limit
+    parts = []
+    position = 0
+    for chunk in iter_text_chunks(path, chunk_size):
+        chunk_end = position + len(chunk)
+        if chunk_end > start:
+            parts.append(chunk[max(start - position, 0) : end - position])
+        position = chunk_end
+        if position >= end:
+            break
+    return "".join(parts)
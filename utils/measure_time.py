@@ -1,9 +1,20 @@
 import time
 
+
+def formatar_ms(tempo_ms):
+    """Formata um tempo em milissegundos com duas casas e vírgula decimal."""
+    return f"{tempo_ms:.2f}".replace(".", ",")
+
+
 def medir_tempo(func, *args, **kwargs):
     inicio = time.perf_counter()
     resultado = func(*args, **kwargs)
     fim = time.perf_counter()
     tempo_ms = (fim - inicio) * 1000
-    tempo_formatado = f"{tempo_ms:.2f}".replace(".", ",")
+    tempo_formatado = formatar_ms(tempo_ms)
     return resultado, tempo_formatado
+
+
+def formatar_kib(total_bytes):
+    """Formata um total de bytes em KiB com duas casas e vírgula decimal."""
+    return f"{total_bytes / 1024:.2f}".replace(".", ",")